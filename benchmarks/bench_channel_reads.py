@@ -0,0 +1,70 @@
+"""Compares repeated small reads with a per-read and a shared VolumeDataAccessManager.
+
+Usage: python benchmarks/bench_channel_reads.py [number_of_reads]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ovds_utils.ovds.enums import BrickSizes, Formats
+from ovds_utils.vds import VDS, AccessModes, Axis, Channel, Components
+
+
+def create_example_vds(path, shape=(251, 51, 126)):
+    names = ["Sample", "Crossline", "Inline"]
+    return VDS(
+        path,
+        axes=[
+            Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+            for i, s in enumerate(shape)
+        ],
+        channels=[
+            Channel(
+                name="Amplitude",
+                format=Formats.R32,
+                unit="unitless",
+                value_range_min=0.0,
+                value_range_max=1.0,
+                components=Components._1
+            )
+        ],
+        channels_data=[np.random.rand(*shape).astype(np.float32)],
+        databrick_size=BrickSizes._64,
+        access_mode=AccessModes.Create
+    )
+
+
+def read(channel, i, new_manager):
+    if new_manager:
+        # access_manager creates a manager again, as every read did before managers were shared
+        channel._access_manager = None
+    return channel._request_data(channel._vds_source, (i, 0, 0), (i + 1, 1, 5)).result()
+
+
+def measure(channel, reads, new_manager):
+    n = channel.shape[0]
+    start = time.perf_counter()
+    for r in range(reads):
+        read(channel, r % n, new_manager)
+    return time.perf_counter() - start
+
+
+def main(reads: int = 2000):
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_example_vds(path).close()
+        with VDS(path) as vds:
+            # both sides time the same subset request path, only the manager differs
+            before = measure(vds.channel(0), reads, new_manager=True)
+            after = measure(vds.channel(0), reads, new_manager=False)
+
+    print(f"reads: {reads}")
+    print(f"manager per read:  {before:.3f}s ({before / reads * 1e6:.1f} us/read)")
+    print(f"shared manager:    {after:.3f}s ({after / reads * 1e6:.1f} us/read)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,71 @@
+"""Compares NaN initialization of a new VDS with per-page temporary arrays and with in-place fills.
+
+Usage: python benchmarks/bench_init_value.py [inlines]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ovds_utils.ovds.enums import AccessModes, BrickSizes, Formats
+from ovds_utils.ovds.writing import FORMAT2NPTYPE, write_nan_pages
+from ovds_utils.vds import VDS, Axis, Channel, Components
+
+
+def write_nan_pages_with_temporaries(accessor, format):
+    dtype = FORMAT2NPTYPE[format]
+    for c in range(accessor.getChunkCount()):
+        page = accessor.createPage(c)
+        buf = np.array(page.getWritableBuffer(), copy=False, dtype=dtype)
+        buf[:, :, :] = np.full(buf.shape, np.nan, dtype=dtype)
+        page.release()
+    accessor.commit()
+
+
+def measure(path, shape, fn):
+    names = ["Sample", "Crossline", "Inline"]
+    vds = VDS(
+        path,
+        axes=[
+            Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+            for i, s in enumerate(shape)
+        ],
+        channels=[
+            Channel(
+                name="Channel0",
+                format=Formats.R64,
+                unit="unitless",
+                value_range_min=0.0,
+                value_range_max=1.0,
+                components=Components._1
+            )
+        ],
+        databrick_size=BrickSizes._128,
+        access_mode=AccessModes.Create
+    )
+    accessor = vds._create_accessor(access_mode=AccessModes.Create)
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(accessor, Formats.R64.value)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    vds.close()
+    return elapsed, peak
+
+
+def main(inlines: int = 512):
+    shape = (inlines, 512, 512)
+    with TemporaryDirectory() as dir:
+        before = measure(os.path.join(dir, "before.vds"), shape, write_nan_pages_with_temporaries)
+        after = measure(os.path.join(dir, "after.vds"), shape, write_nan_pages)
+    print(f"shape: {shape}, R64")
+    print(f"temporary arrays: {before[0]:.3f}s, peak traced memory {before[1] / 2**20:.1f} MiB")
+    print(f"in-place fill:    {after[0]:.3f}s, peak traced memory {after[1] / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
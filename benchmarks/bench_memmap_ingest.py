@@ -0,0 +1,66 @@
+"""Reports peak resident memory when ingesting a raw on-disk file through MemmapSource.
+
+The raw file is written slab by slab so it can be made larger than RAM.
+
+Usage: python benchmarks/bench_memmap_ingest.py [inlines] [workers]
+"""
+import os
+import resource
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ovds_utils.ovds import MemmapSource
+from ovds_utils.ovds.enums import BrickSizes, Formats
+from ovds_utils.vds import VDS, AccessModes, Axis, Channel, Components
+
+
+def write_raw_file(path, shape, slab_size=16):
+    with open(path, "wb") as f:
+        for i in range(0, shape[0], slab_size):
+            np.random.rand(min(slab_size, shape[0] - i), *shape[1:]).astype(np.float32).tofile(f)
+
+
+def main(inlines: int = 1024, workers: int = 1):
+    shape = (inlines, 512, 512)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+        for i, s in enumerate(shape)
+    ]
+    channels = [
+        Channel(
+            name="Amplitude",
+            format=Formats.R32,
+            unit="unitless",
+            value_range_min=0.0,
+            value_range_max=1.0,
+            components=Components._1
+        )
+    ]
+    with TemporaryDirectory() as dir:
+        source = MemmapSource(os.path.join(dir, "data.dat"), dtype=np.float32, shape=shape)
+        write_raw_file(source.path, shape)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels=channels,
+            channels_data=[source],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            workers=workers
+        ).close()
+        elapsed = time.perf_counter() - start
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"file size: {np.prod(shape) * 4 / 2**20:.0f} MiB, workers: {workers}")
+    print(f"elapsed: {elapsed:.3f}s")
+    print(f"peak RSS before ingest: {rss_before / 2**10:.0f} MiB, after ingest: {rss_after / 2**10:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,107 @@
+"""Measures VDS open latency with in-process layout introspection, with the VDSInfo binary, with
+a sidecar info cache and through a VDSPool, and the cost of page accessors on a cube with many channels.
+
+Usage: python benchmarks/bench_open.py [number_of_opens] [number_of_channels]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from bench_channel_reads import create_example_vds
+
+from ovds_utils.cache import InfoCache
+from ovds_utils.ovds.enums import BrickSizes, Formats
+from ovds_utils.pool import VDSPool
+from ovds_utils.vds import VDS, AccessModes, Axis, Channel, Components
+
+
+def measure(path: str, opens: int, touch_accessors: bool = False, touch_geometry: bool = False, **kwargs) -> float:
+    start = time.perf_counter()
+    for _ in range(opens):
+        vds = VDS(path, **kwargs)
+        if touch_accessors:
+            for channel in vds.channels:
+                channel.accessor
+        if touch_geometry:
+            vds.channel(0).geometry
+        vds.close()
+    return time.perf_counter() - start
+
+
+def measure_pooled(path: str, opens: int) -> float:
+    pool = VDSPool(max_open=4)
+    start = time.perf_counter()
+    for _ in range(opens):
+        with pool.handle(path):
+            pass
+    elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed
+
+
+def create_multi_channel_vds(path: str, channels: int, shape=(64, 64, 64)):
+    names = ["Sample", "Crossline", "Inline"]
+    data = np.random.rand(*shape).astype(np.float32)
+    return VDS(
+        path,
+        axes=[
+            Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+            for i, s in enumerate(shape)
+        ],
+        channels=[
+            Channel(
+                name=f"Attribute{i}",
+                format=Formats.R32,
+                unit="unitless",
+                value_range_min=0.0,
+                value_range_max=1.0,
+                components=Components._1
+            )
+            for i in range(channels)
+        ],
+        channels_data=[data] * channels,
+        databrick_size=BrickSizes._64,
+        access_mode=AccessModes.Create
+    )
+
+
+def main(opens: int = 50, channels: int = 32):
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_example_vds(path).close()
+
+        vdsinfo = measure(path, opens, use_vdsinfo_bin=True)
+        layout = measure(path, opens)
+        pooled = measure_pooled(path, opens)
+        cache = InfoCache(os.path.join(dir, "info"))
+        VDS(path, info_cache=cache, use_vdsinfo_bin=True).close()
+        cached = measure(path, opens, info_cache=cache, use_vdsinfo_bin=True)
+
+        path = os.path.join(dir, "large.vds")
+        create_multi_channel_vds(path, 1, shape=(512, 512, 512)).close()
+        geometry = measure(path, opens, touch_geometry=True)
+        cache = InfoCache(os.path.join(dir, "info"))
+        VDS(path, info_cache=cache).close()
+        cached_geometry = measure(path, opens, touch_geometry=True, info_cache=cache)
+
+        path = os.path.join(dir, "channels.vds")
+        create_multi_channel_vds(path, channels).close()
+        lazy = measure(path, opens)
+        eager = measure(path, opens, touch_accessors=True)
+
+    print(f"opens: {opens}")
+    print(f"VDSInfo subprocess: {vdsinfo:.3f}s ({vdsinfo / opens * 1e3:.2f} ms/open)")
+    print(f"layout:             {layout:.3f}s ({layout / opens * 1e3:.2f} ms/open)")
+    print(f"info cache:         {cached:.3f}s ({cached / opens * 1e3:.2f} ms/open)")
+    print(f"layout and geometry of 512 chunks:            {geometry:.3f}s ({geometry / opens * 1e3:.2f} ms/open)")
+    print(f"layout and geometry of 512 chunks, cached:    {cached_geometry:.3f}s "
+          f"({cached_geometry / opens * 1e3:.2f} ms/open)")
+    print(f"VDSPool:            {pooled:.3f}s ({pooled / opens * 1e3:.2f} ms/open)")
+    print(f"{channels} channels, lazy accessors:      {lazy:.3f}s ({lazy / opens * 1e3:.2f} ms/open)")
+    print(f"{channels} channels, all accessors built: {eager:.3f}s ({eager / opens * 1e3:.2f} ms/open)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
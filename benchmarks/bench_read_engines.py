@@ -0,0 +1,35 @@
+"""Compares the subset and bricks read engines on windows panning across neighbouring inlines.
+
+Usage: python benchmarks/bench_read_engines.py [windows] [window_size]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+from bench_channel_reads import create_example_vds
+
+from ovds_utils.vds import VDS
+
+
+def main(windows: int = 200, window_size: int = 32):
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_example_vds(path).close()
+        for engine in ("subset", "bricks"):
+            with VDS(path, read_engine=engine) as vds:
+                n = vds.shape[0] - window_size
+                start = time.perf_counter()
+                for w in range(windows):
+                    i = w % n
+                    vds[i:i + window_size, :, 10:70]
+                elapsed = time.perf_counter() - start
+                stats = vds.page_cache.stats
+            print(
+                f"{engine:7s} {elapsed:.3f}s ({elapsed / windows * 1e3:.2f} ms/window), "
+                f"cache hits: {stats['hits']}, misses: {stats['misses']}"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,39 @@
+"""Compares reading scattered traces one by one with the brick grouped read_traces.
+
+Usage: python benchmarks/bench_read_traces.py [number_of_traces]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from bench_channel_reads import create_example_vds
+
+from ovds_utils.vds import VDS
+
+
+def main(traces: int = 10000):
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_example_vds(path).close()
+        with VDS(path) as vds:
+            coords = np.stack(
+                [np.random.randint(0, vds.shape[0], traces), np.random.randint(0, vds.shape[1], traces)], axis=1
+            )
+            start = time.perf_counter()
+            looped = np.stack([vds[int(i), int(j), :] for i, j in coords])
+            loop_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            batched = vds.read_traces(coords)
+            batch_time = time.perf_counter() - start
+
+            assert np.array_equal(looped, batched)
+            print(f"per trace loop: {loop_time:.3f}s ({loop_time / traces * 1e6:.1f} us/trace)")
+            print(f"read_traces:    {batch_time:.3f}s ({batch_time / traces * 1e6:.1f} us/trace)")
+            print(f"page cache: {vds.page_cache.stats}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,57 @@
+"""Reports peak traced memory of streaming ingest with VDSWriter.
+
+Slabs are generated on the fly so the full cube never exists in memory.
+
+Usage: python benchmarks/bench_streaming_ingest.py [inlines] [slab_size]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ovds_utils.ovds.enums import BrickSizes, Formats
+from ovds_utils.vds import Axis, Channel, Components
+from ovds_utils.writer import VDSWriter
+
+
+def slabs(shape, slab_size):
+    for i in range(0, shape[0], slab_size):
+        stop = min(i + slab_size, shape[0])
+        yield (i, stop), np.random.rand(stop - i, *shape[1:]).astype(np.float32)
+
+
+def main(inlines: int = 1024, slab_size: int = 16):
+    shape = (inlines, 256, 256)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+        for i, s in enumerate(shape)
+    ]
+    channels = [
+        Channel(
+            name="Amplitude",
+            format=Formats.R32,
+            unit="unitless",
+            value_range_min=0.0,
+            value_range_max=1.0,
+            components=Components._1
+        )
+    ]
+    with TemporaryDirectory() as dir:
+        tracemalloc.start()
+        start = time.perf_counter()
+        with VDSWriter(os.path.join(dir, "example.vds"), axes, channels, databrick_size=BrickSizes._64) as writer:
+            writer.write_slabs(slabs(shape, slab_size))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"shape: {shape}, volume size: {np.prod(shape) * 4 / 2**20:.0f} MiB")
+    print(f"elapsed: {elapsed:.3f}s, peak traced memory: {peak / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,63 @@
+"""Measures write_pages throughput for a growing number of worker threads.
+
+Usage: python benchmarks/bench_write_pages.py [inlines] [max_workers]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import openvds
+
+from ovds_utils.ovds.enums import AccessModes, BrickSizes, Formats
+from ovds_utils.ovds.writing import write_pages
+from ovds_utils.vds import VDS, Axis, Channel, Components
+
+
+def main(inlines: int = 512, max_workers: int = os.cpu_count() or 1):
+    shape = (inlines, 256, 256)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+        for i, s in enumerate(shape)
+    ]
+    channels = [
+        Channel(
+            name="Amplitude",
+            format=Formats.R32,
+            unit="unitless",
+            value_range_min=0.0,
+            value_range_max=1.0,
+            components=Components._1
+        )
+    ]
+    print(f"shape: {shape}, size: {data.nbytes / 2**20:.0f} MiB")
+    workers = 1
+    while workers <= max_workers:
+        with TemporaryDirectory() as dir:
+            vds = VDS(
+                os.path.join(dir, "example.vds"),
+                axes=axes,
+                channels=channels,
+                databrick_size=BrickSizes._64,
+                access_mode=AccessModes.Create
+            )
+            accessor = openvds.getAccessManager(vds._vds_source).createVolumeDataPageAccessor(
+                dimensionsND=openvds.DimensionsND.Dimensions_012,
+                lod=0,
+                channel=0,
+                maxPages=2 * workers,
+                accessMode=AccessModes.Create.value,
+            )
+            start = time.perf_counter()
+            write_pages(accessor, data, Formats.R32.value, workers=workers)
+            elapsed = time.perf_counter() - start
+            vds.close()
+        print(f"workers: {workers:3d} {elapsed:.3f}s ({data.nbytes / 2**20 / elapsed:.0f} MiB/s)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
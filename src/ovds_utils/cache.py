@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.geometry import ChunkGeometry
+from ovds_utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PageCache:
+    """Bounded LRU cache of read pages keyed by (channel, lod, chunk number).
+
+    Each entry keeps the OpenVDS page alive together with a numpy view of its buffer.
+    The page is released when the entry is evicted, so arrays returned by ``get`` must
+    not be used after eviction unless the entry is pinned.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, np.array]] = OrderedDict()
+        self._pins: Dict[Hashable, int] = {}
+        self._lock = RLock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(entries={len(self)}, nbytes={self.nbytes}, max_bytes={self.max_bytes})>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            nbytes=self.nbytes,
+        )
+
+    def get(self, key: Hashable, loader: Callable[[], Tuple[Any, np.array]]) -> np.array:
+        """returns cached array for key, on a miss loader must return (page, array)"""
+        return self._get(key, loader)
+
+    @contextmanager
+    def pinned(self, key: Hashable, loader: Callable[[], Tuple[Any, np.array]]) -> Iterator[np.array]:
+        """gets and pins the entry, so its array stays valid inside the with block"""
+        array = self._get(key, loader, pin=True)
+        try:
+            yield array
+        finally:
+            self.unpin(key)
+
+    def _get(self, key: Hashable, loader: Callable[[], Tuple[Any, np.array]], pin: bool = False) -> np.array:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if pin:
+                    self.pin(key)
+                return self._entries[key][1]
+            self.misses += 1
+
+        # pages are loaded outside of the lock, so misses on different keys do not serialize
+        page, array = loader()
+        with self._lock:
+            if key in self._entries:
+                page.release()
+                self._entries.move_to_end(key)
+                array = self._entries[key][1]
+            else:
+                self._entries[key] = (page, array)
+                self.nbytes += array.nbytes
+            if pin:
+                self.pin(key)
+            self._evict(keep=key)
+            return array
+
+    def pin(self, key: Hashable):
+        with self._lock:
+            if key not in self._entries:
+                raise VDSException(f"Page {key} is not cached and cannot be pinned.")
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: Hashable):
+        with self._lock:
+            count = self._pins.get(key, 0)
+            if count <= 1:
+                self._pins.pop(key, None)
+            else:
+                self._pins[key] = count - 1
+            self._evict()
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            if key in self._entries and key not in self._pins:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._pins.clear()
+
+    def _remove(self, key: Hashable):
+        page, array = self._entries.pop(key)
+        self.nbytes -= array.nbytes
+        page.release()
+
+    def _evict(self, keep: Hashable = None):
+        if self.nbytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            if self.nbytes <= self.max_bytes:
+                break
+            if key in self._pins or key == keep:
+                continue
+            self._remove(key)
+            self.evictions += 1
+        if self.nbytes > self.max_bytes:
+            logger.debug(f"Page cache exceeds {self.max_bytes} bytes because of pinned pages")
+
+
+class InfoCache:
+    """Sidecar files with the layout info and chunk geometry of VDS sources kept in a local directory.
+
+    Entries are keyed by path and connection string and hold a fingerprint of the source,
+    size and modification time of local files. An entry is served only while the fingerprint
+    still matches. Remote sources such as cloud URLs have no cheap fingerprint and are cached
+    only with trust_remote, their entries are then served until they are cleared.
+    """
+
+    VERSION = 1
+    REMOTE_FINGERPRINT = "trusted"
+
+    def __init__(self, directory: Union[str, Path], trust_remote: bool = False) -> None:
+        self.directory = Path(directory)
+        self.trust_remote = trust_remote
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(directory={self.directory}, trust_remote={self.trust_remote})>"
+
+    def fingerprint(self, path: str) -> Optional[str]:
+        """returns size and modification time of a local source, remote sources are fingerprinted when trusted"""
+        if "://" in path:
+            return self.REMOTE_FINGERPRINT if self.trust_remote else None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def file(self, path: str, connection_string: str = "") -> Path:
+        key = hashlib.sha1(f"{path}\0{connection_string}".encode()).hexdigest()
+        return self.directory / f"{key}.json"
+
+    def get(
+        self,
+        path: str,
+        connection_string: str = ""
+    ) -> Optional[Tuple[Dict[str, Any], Optional[ChunkGeometry]]]:
+        """returns info and LOD 0 chunk geometry of the source or None when there is no valid entry"""
+        fingerprint = self.fingerprint(path)
+        if fingerprint is None:
+            return None
+        try:
+            with open(self.file(path, connection_string)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if (
+            entry.get("version") != self.VERSION
+            or entry.get("path") != path
+            or entry.get("fingerprint") != fingerprint
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        geometry = entry.get("geometry")
+        return entry["info"], self._decode_geometry(geometry) if geometry is not None else None
+
+    def put(
+        self,
+        path: str,
+        info: Dict[str, Any],
+        connection_string: str = "",
+        geometry: ChunkGeometry = None,
+    ):
+        fingerprint = self.fingerprint(path)
+        if fingerprint is None:
+            return
+        file = self.file(path, connection_string)
+        entry = dict(
+            version=self.VERSION,
+            path=path,
+            fingerprint=fingerprint,
+            info=info,
+            geometry=self._encode_geometry(geometry) if geometry is not None else None,
+        )
+        tmp = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # concurrent writers of the same entry use their own files, readers see either file complete
+            with NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as f:
+                tmp = f.name
+                json.dump(entry, f)
+            os.replace(tmp, file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write info cache entry of {path}: {e}")
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+    @staticmethod
+    def _encode_geometry(geometry: ChunkGeometry) -> Dict[str, Any]:
+        # bounds are kept as raw int64 bytes, parsing them is much faster than JSON lists
+        bounds = np.stack([geometry.mins, geometry.maxs, geometry.inner_mins, geometry.inner_maxs]).astype("<i8")
+        return dict(bounds=base64.b64encode(bounds.tobytes()).decode("ascii"), shape=list(geometry.shape))
+
+    @staticmethod
+    def _decode_geometry(geometry: Dict[str, Any]) -> ChunkGeometry:
+        bounds = np.frombuffer(base64.b64decode(geometry["bounds"]), dtype="<i8").astype(np.int64).reshape(4, -1, 3)
+        return ChunkGeometry(*bounds, geometry["shape"])
+
+    def clear(self):
+        for file in self.directory.glob("*.json"):
+            file.unlink()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.logging import get_logger
+from ovds_utils.ovds.writing import FORMAT2NPTYPE
+from ovds_utils.vds import VDS, Channel
+
+logger = get_logger(__name__)
+
+
+def brick_chunks(channel: Channel) -> Tuple[Tuple[int, ...], ...]:
+    """returns dask chunks of the channel aligned with its bricks"""
+    geometry = channel.geometry
+    return tuple(
+        tuple(np.diff(np.append(starts, n)).tolist()) for starts, n in zip(geometry.starts, geometry.shape)
+    )
+
+
+def read_brick(vds: VDS, channel: int, lod: int, number: int) -> np.array:
+    """reads samples of one brick without margins through the page accessor"""
+    source = vds.lod_view(lod, channel)
+    chunk = source.get_chunk(number)
+    mins, _ = source.geometry.bounds(number)
+    inner_mins, inner_maxs = source.geometry.bounds(number, margin=False)
+    return chunk[tuple(slice(i - m, j - m) for i, j, m in zip(inner_mins, inner_maxs, mins))]
+
+
+def to_dask(vds: VDS, channel: int = 0, lod: int = 0):
+    """returns dask array of the channel where every block is read from exactly one brick
+
+    Process based schedulers unpickle ``vds`` into a handle shared by the tasks of every worker,
+    pickling flushes pages written through ``vds`` so the workers read them. Pages written after
+    the graph was sent are not seen by the workers.
+    """
+    try:
+        import dask.array as da
+        from dask.base import tokenize
+    except ImportError:
+        raise VDSException("dask is required for to_dask, install it with: pip install dask[array]")
+
+    source = vds.lod_view(lod, channel)
+    geometry = source.geometry
+    name = "vds-" + tokenize(vds.path, vds.connection_string, channel, lod)
+    graph = {}
+    for number in range(geometry.count):
+        position = tuple(int(np.searchsorted(geometry.starts[d], geometry.inner_mins[number, d])) for d in range(3))
+        graph[(name,) + position] = (read_brick, vds, channel, lod, number)
+    return da.Array(graph, name, chunks=brick_chunks(source), dtype=FORMAT2NPTYPE[source.format.value])
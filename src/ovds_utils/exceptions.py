@@ -4,3 +4,7 @@ class VDSException(Exception):
 
 class VDSMetadataException(VDSException):
     pass
+
+
+class VDSRequestException(VDSException):
+    pass
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from itertools import product
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import openvds
+
+from ovds_utils.exceptions import VDSException
+
+
+class ChunkGeometry:
+    """Precomputed bounds of every chunk of one channel and LOD, in numpy axis order.
+
+    ``mins``/``maxs`` include margins, ``inner_mins``/``inner_maxs`` exclude them.
+    """
+
+    def __init__(
+        self,
+        mins: np.array,
+        maxs: np.array,
+        inner_mins: np.array,
+        inner_maxs: np.array,
+        shape: Sequence[int],
+    ) -> None:
+        self.mins = mins
+        self.maxs = maxs
+        self.inner_mins = inner_mins
+        self.inner_maxs = inner_maxs
+        self.shape = tuple(shape)
+        self.starts = [np.unique(inner_mins[:, d]) for d in range(3)]
+        self.brick_size = tuple(
+            int(s[1] - s[0]) if len(s) > 1 else int(n) for s, n in zip(self.starts, self.shape)
+        )
+        self.grid = np.full([len(s) for s in self.starts], -1, dtype=np.int64)
+        positions = [np.searchsorted(self.starts[d], inner_mins[:, d]) for d in range(3)]
+        self.grid[tuple(positions)] = np.arange(len(mins))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(count={self.count}, grid={self.grid.shape})>"
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def count(self) -> int:
+        return len(self.mins)
+
+    @classmethod
+    def from_accessor(cls, accessor: openvds.core.VolumeDataPageAccessor, lod: int = 0) -> ChunkGeometry:
+        """bounds are converted to samples of the LOD level, OpenVDS reports them in LOD 0 samples"""
+        count = accessor.getChunkCount()
+        mins = np.empty((count, 3), dtype=np.int64)
+        maxs = np.empty((count, 3), dtype=np.int64)
+        inner_mins = np.empty((count, 3), dtype=np.int64)
+        inner_maxs = np.empty((count, 3), dtype=np.int64)
+        for c in range(count):
+            _min, _max = accessor.getChunkMinMax(c)
+            mins[c], maxs[c] = _min[2::-1], _max[2::-1]
+            _min, _max = accessor.getChunkMinMaxExcludingMargin(c)
+            inner_mins[c], inner_maxs[c] = _min[2::-1], _max[2::-1]
+        shape = np.array(accessor.getNumSamples()[2::-1] if count else (0, 0, 0), dtype=np.int64)
+        if lod:
+            factor = 1 << lod
+            mins, inner_mins = mins // factor, inner_mins // factor
+            maxs, inner_maxs, shape = -(-maxs // factor), -(-inner_maxs // factor), -(-shape // factor)
+        return cls(mins, maxs, inner_mins, inner_maxs, shape.tolist())
+
+    def check(self, number: int):
+        if not 0 <= number < self.count:
+            raise VDSException(f"Chunk number is out of range of: 0 to {self.count-1}")
+
+    def bounds(self, number: int, margin: bool = True) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        self.check(number)
+        if margin:
+            return tuple(self.mins[number].tolist()), tuple(self.maxs[number].tolist())
+        return tuple(self.inner_mins[number].tolist()), tuple(self.inner_maxs[number].tolist())
+
+    def slices(self, number: int, margin: bool = True) -> Tuple[slice, ...]:
+        return tuple(slice(i, j) for i, j in zip(*self.bounds(number, margin)))
+
+    def chunk_at(self, coordinate: Sequence[int]) -> int:
+        """returns number of the chunk containing the sample coordinate"""
+        position = []
+        for d in range(3):
+            if not 0 <= coordinate[d] < self.shape[d]:
+                raise VDSException(f"Coordinate {tuple(coordinate)} is out of range of {self.shape}")
+            position.append(coordinate[d] // self.brick_size[d])
+        return int(self.grid[tuple(position)])
+
+    def intersecting(
+        self,
+        begin: Sequence[int],
+        end: Sequence[int]
+    ) -> List[Tuple[int, Tuple[int, int, int], Tuple[int, int, int]]]:
+        """returns (chunk, begin, end) of every chunk intersecting the region from begin to end"""
+        axes = []
+        for d in range(3):
+            first = begin[d] // self.brick_size[d]
+            last = (end[d] - 1) // self.brick_size[d] + 1
+            intervals = []
+            for i in range(first, min(last, len(self.starts[d]))):
+                start = int(self.starts[d][i])
+                stop = int(self.starts[d][i + 1]) if i + 1 < len(self.starts[d]) else self.shape[d]
+                intervals.append((i, max(begin[d], start), min(end[d], stop)))
+            axes.append(intervals)
+        return [
+            (int(self.grid[a[0], b[0], c[0]]), (a[1], b[1], c[1]), (a[2], b[2], c[2]))
+            for a, b, c in product(*axes)
+        ]
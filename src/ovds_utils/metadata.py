@@ -28,6 +28,34 @@ class MetadataValue:
         return self._type.value
 
 
+class LayoutMetadataValue(MetadataValue):
+    """Metadata value read from the layout on first access, BLOB values are exposed as memoryviews."""
+
+    def __init__(self, layout: openvds.core.VolumeDataLayout, name: AnyStr, category: AnyStr, type: AnyStr) -> None:
+        super().__init__(None, category, type)
+        self._layout = layout
+        self.name = name
+        self._loaded = False
+
+    @property
+    def value(self) -> Any:
+        if not self._loaded:
+            if self._layout is None:
+                raise VDSMetadataException(f"Metadata {self.name} was not loaded before the VDS source was closed.")
+            value = METADATATYPE_TO_OVDS_GET_FUNCTION[self.type](self._layout, self.category, self.name)
+            self._value = memoryview(value) if self._type == MetadataTypes.BLOB else value
+            self._loaded = True
+        return self._value
+
+    @value.setter
+    def value(self, value: Any):
+        self._value = value
+        self._loaded = True
+
+    def detach(self):
+        self._layout = None
+
+
 class MetadataContainer(dict):
     def __init__(self, **kwargs: Dict[AnyStr, MetadataValue]) -> None:
         super().__init__()
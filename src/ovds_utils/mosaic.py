@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.logging import get_logger
+from ovds_utils.ovds.writing import FORMAT2NPTYPE
+from ovds_utils.vds import VDS, Channel, VDSChunk, normalize_key, sampled_overlap
+
+logger = get_logger(__name__)
+
+
+class VDSMosaic:
+    """Tiles of VDS sources placed at origins of a common sample grid.
+
+    Tiles may be placed along any of the three axes but must not overlap, samples not
+    covered by any tile read as ``no_value``. Tile extents are kept in arrays, so the
+    tiles intersecting a key are found with one vectorized interval test per axis.
+    """
+
+    def __init__(
+        self,
+        tiles: Sequence[Tuple[VDS, Sequence[int]]] = None,
+        shape: Sequence[int] = None,
+        no_value: float = 0.0,
+        channel: int = 0,
+        workers: int = None,
+    ) -> None:
+        self.no_value = no_value
+        self.channel = channel
+        self.workers = workers
+        self._executor = None
+        self._shape = tuple(shape) if shape is not None else None
+        self._tiles: List[VDS] = []
+        self._begins = np.empty((0, 3), dtype=np.int64)
+        self._ends = np.empty((0, 3), dtype=np.int64)
+        for vds, origin in tiles or []:
+            self.add_tile(vds, origin)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(tiles={len(self)}, shape={self.shape})>"
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        if self._shape is not None:
+            return self._shape
+        if not self._tiles:
+            return None
+        return tuple(self._ends.max(axis=0).tolist())
+
+    @property
+    def tiles(self) -> List[Tuple[VDS, Tuple[int, ...]]]:
+        return [(t, tuple(b.tolist())) for t, b in zip(self._tiles, self._begins)]
+
+    def add_tile(self, vds: VDS, origin: Sequence[int]):
+        begin = np.array(origin, dtype=np.int64)
+        end = begin + np.array(vds.shape, dtype=np.int64)
+        if (begin < 0).any() or (self._shape is not None and (end > self._shape).any()):
+            raise VDSException(f"Tile at {tuple(origin)} of shape {tuple(vds.shape)} is out of range of {self._shape}")
+        overlapping = self.intersecting(begin, end)
+        if overlapping:
+            raise VDSException(f"Tile at {tuple(origin)} overlaps tiles {overlapping}")
+        self._tiles.append(vds)
+        self._begins = np.vstack([self._begins, begin])
+        self._ends = np.vstack([self._ends, end])
+
+    def intersecting(self, begin: Sequence[int], end: Sequence[int]) -> List[int]:
+        """returns indices of tiles intersecting the region from begin to end"""
+        mask = np.all((self._begins < np.asarray(end)) & (self._ends > np.asarray(begin)), axis=1)
+        return np.flatnonzero(mask).tolist()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _channel(self, tile: int) -> Channel:
+        return self._tiles[tile].channel(self.channel)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.result_type(*[FORMAT2NPTYPE[self._channel(i).format.value] for i in range(len(self))])
+
+    def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
+        if not self._tiles:
+            raise VDSException("Mosaic has no tiles.")
+        ranges, squeeze, flip = normalize_key(key, self.shape)
+        out = np.full([len(r) for r in ranges], self.no_value, dtype=self.dtype)
+
+        if all(len(r) for r in ranges):
+            parts = []
+            for i in self.intersecting([r[0] for r in ranges], [r[-1] + 1 for r in ranges]):
+                overlaps = [sampled_overlap(r, lo, hi) for r, lo, hi in zip(ranges, self._begins[i], self._ends[i])]
+                if any(o is None for o in overlaps):
+                    continue
+                src = tuple(o[0] for o in overlaps)
+                dst = tuple(o[1] for o in overlaps)
+                parts.append((self._channel(i), src, out.__getitem__(dst)))
+            futures = [self.executor.submit(c.read_into, src, target) for c, src, target in parts]
+            for f in futures:
+                f.result()
+
+        post_key = Channel._post_key(squeeze, flip, [1] * len(ranges))
+        return out if post_key is None else out.__getitem__(post_key)
+
+    def chunks(self) -> Iterator[Tuple[Tuple[slice, ...], VDSChunk]]:
+        """yields chunks of every tile with their slices in mosaic coordinates"""
+        for i in range(len(self)):
+            offset = self._begins[i]
+            for chunk in self._channel(i).chunks():
+                yield tuple(slice(s.start + o, s.stop + o) for s, o in zip(chunk.slices, offset)), chunk
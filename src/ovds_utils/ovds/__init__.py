@@ -2,4 +2,4 @@ from .copy import copy_vds  # NOQA
 from .enums import (LOD, AccessModes, BrickSizes, Components, Dimensions, Formats, InitValue, MetadataTypes,  # NOQA
                     Options)
 from .utils import METADATATYPE_TO_OVDS_GET_FUNCTION, METADATATYPE_TO_OVDS_SET_FUNCTION  # NOQA
-from .writing import create_vds, write_pages  # NOQA
+from .writing import MemmapSource, create_vds, write_pages  # NOQA
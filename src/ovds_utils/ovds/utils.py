@@ -132,6 +132,49 @@ def get_vds_info(path: AnyStr, connection_string: AnyStr):
         raise Exception(f"Could not parse VDSInfo {e}")
 
 
+def get_vds_info_from_layout(layout: openvds.core.VolumeDataLayout) -> Dict[str, Any]:
+    """describes layout in the same structure as VDSInfo output without spawning the binary"""
+    layout_descriptor = layout.getLayoutDescriptor()
+    axis_descriptors = []
+    for i in range(layout.getDimensionality()):
+        axis = layout.getAxisDescriptor(i)
+        axis_descriptors.append(
+            dict(
+                name=axis.name,
+                unit=axis.unit,
+                numSamples=axis.numSamples,
+                coordinateMin=axis.coordinateMin,
+                coordinateMax=axis.coordinateMax,
+            )
+        )
+    channel_descriptors = []
+    for i in range(layout.getChannelCount()):
+        channel = layout.getChannelDescriptor(i)
+        channel_descriptors.append(
+            dict(
+                name=channel.name,
+                unit=channel.unit,
+                format=channel.format.name,
+                components=channel.components.name,
+                valueRange=[channel.valueRangeMin, channel.valueRangeMax],
+                noValue=channel.noValue,
+                useNoValue=channel.useNoValue,
+            )
+        )
+    return dict(
+        axisDescriptors=axis_descriptors,
+        channelDescriptors=channel_descriptors,
+        layoutDescriptor=dict(
+            brickSize=layout_descriptor.brickSize.name,
+            brickSize2DMultiplier=layout_descriptor.brickSizeMultiplier2D,
+            lodLevels=layout_descriptor.getLODLevels().name,
+            negativeMargin=layout_descriptor.negativeMargin,
+            positiveMargin=layout_descriptor.positiveMargin,
+            fullResolutionDimension=layout_descriptor.fullResolutionDimension,
+        ),
+    )
+
+
 def read_metadata_container(
     container: openvds.core.MetadataContainer,
 ) -> List[Dict[str, str]]:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from typing import Any, AnyStr, Dict, List
+from typing import Any, AnyStr, Callable, Dict, List, Sequence, Union
 
 import numpy as np
 import openvds
@@ -21,48 +23,182 @@ FORMAT2NPTYPE = {
 }
 
 
-def write_pages(
-    accessor: openvds.core.VolumeDataPageAccessor, data: np.array,
-    format: openvds.VolumeDataChannelDescriptor.Format
+class MemmapSource:
+    """describes an array stored on disk that is memory mapped only when pages are written"""
+
+    def __init__(
+        self,
+        path: Union[AnyStr, os.PathLike],
+        dtype: np.dtype = None,
+        shape: Sequence[int] = None,
+        offset: int = 0,
+    ) -> None:
+        self.path = path
+        self.dtype = np.dtype(dtype) if dtype is not None else None
+        self.shape = tuple(shape) if shape is not None else None
+        self.offset = offset
+        if str(path).endswith(".npy"):
+            self._read_npy_header()
+        if self.dtype is None or self.shape is None:
+            raise ValueError(f"dtype and shape are required to map raw file {self.path}")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(path={self.path}, dtype={self.dtype}, shape={self.shape})>"
+
+    def _read_npy_header(self):
+        with open(self.path, "rb") as f:
+            if np.lib.format.read_magic(f) == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if fortran_order:
+                raise ValueError(f"Fortran ordered arrays are not supported: {self.path}")
+            if self.dtype is not None and self.dtype != dtype:
+                raise ValueError(f"dtype {self.dtype} does not match dtype {dtype} stored in {self.path}")
+            if self.shape is not None and self.shape != tuple(shape):
+                raise ValueError(f"shape {self.shape} does not match shape {tuple(shape)} stored in {self.path}")
+            self.shape = tuple(shape)
+            self.dtype = dtype
+            self.offset = f.tell()
+
+    def open(self, start: int = 0, stop: int = None) -> np.memmap:
+        """maps rows from start to stop along the first axis"""
+        stop = self.shape[0] if stop is None else stop
+        row_size = int(np.prod(self.shape[1:])) * self.dtype.itemsize
+        return np.memmap(
+            self.path,
+            dtype=self.dtype,
+            mode="r",
+            shape=(stop - start,) + self.shape[1:],
+            offset=self.offset + start * row_size,
+        )
+
+
+def split_chunks(chunks_count: int, workers: int) -> List[range]:
+    """splits chunk numbers into contiguous ranges, one per worker"""
+    workers = max(1, min(workers, chunks_count))
+    step, rest = divmod(chunks_count, workers)
+    ranges = []
+    start = 0
+    for i in range(workers):
+        stop = start + step + (1 if i < rest else 0)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+def _write_chunks(
+    accessor: openvds.core.VolumeDataPageAccessor,
+    chunks: Sequence[int],
+    data: Union[np.array, MemmapSource],
+    dtype: np.dtype,
+    axis0_offset: int = 0,
 ):
-    dtype = FORMAT2NPTYPE[format]
-    for c in range(accessor.getChunkCount()):
+    if isinstance(data, MemmapSource):
+        return _write_mapped_chunks(accessor, chunks, data, dtype)
+    for c in chunks:
         page = accessor.createPage(c)
         buf = np.array(page.getWritableBuffer(), copy=False, dtype=dtype)
         (min, max) = page.getMinMax()
         buf[:, :, :] = data[
-            min[2]: max[2],
+            min[2] - axis0_offset: max[2] - axis0_offset,
             min[1]: max[1],
             min[0]: max[0],
         ]
         page.release()
+
+
+def _write_mapped_chunks(
+    accessor: openvds.core.VolumeDataPageAccessor,
+    chunks: Sequence[int],
+    source: MemmapSource,
+    dtype: np.dtype,
+):
+    # only one brick row of the file is mapped at a time, so resident memory stays bounded
+    rows = {}
+    for c in chunks:
+        _min, _max = accessor.getChunkMinMax(c)
+        rows.setdefault((_min[2], _max[2]), []).append(c)
+    for (r0, r1), row_chunks in rows.items():
+        mapped = source.open(r0, r1)
+        _write_chunks(accessor, row_chunks, mapped, dtype, axis0_offset=r0)
+        del mapped
+
+
+def _run_on_chunks(
+    accessor: openvds.core.VolumeDataPageAccessor,
+    workers: int,
+    max_pages: int,
+    fn: Callable,
+    *args
+):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pages is None:
+        max_pages = max(accessor.getMaxPages(), 2 * workers)
+    if max_pages != accessor.getMaxPages():
+        accessor.setMaxPages(max_pages)
+
+    ranges = split_chunks(accessor.getChunkCount(), workers)
+    if len(ranges) == 1:
+        fn(accessor, ranges[0], *args)
+    else:
+        logger.debug(f"Writing {accessor.getChunkCount()} pages with {len(ranges)} workers")
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(fn, accessor, r, *args) for r in ranges]
+            for f in futures:
+                f.result()
     accessor.commit()
 
 
-def write_nan_pages(
+def write_pages(
+    accessor: openvds.core.VolumeDataPageAccessor, data: Union[np.array, MemmapSource],
+    format: openvds.VolumeDataChannelDescriptor.Format,
+    workers: int = 1,
+    max_pages: int = None,
+):
+    # chunks are numbered with the first axis varying slowest, so contiguous ranges
+    # of chunks read a memory mapped array in file order
+    _run_on_chunks(accessor, workers, max_pages, _write_chunks, data, FORMAT2NPTYPE[format])
+
+
+def _fill_chunks(
     accessor: openvds.core.VolumeDataPageAccessor,
-    format: openvds.VolumeDataChannelDescriptor.Format
+    chunks: Sequence[int],
+    value: Any,
+    dtype: np.dtype,
 ):
-    dtype = FORMAT2NPTYPE[format]
-    for c in range(accessor.getChunkCount()):
+    for c in chunks:
         page = accessor.createPage(c)
-        buf = np.array(page.getWritableBuffer(), copy=False, dtype=dtype)
-        buf[:, :, :] = np.full(buf.shape, np.nan, dtype=dtype)
+        np.array(page.getWritableBuffer(), copy=False, dtype=dtype).fill(value)
         page.release()
-    accessor.commit()
+
+
+def write_constant_pages(
+    accessor: openvds.core.VolumeDataPageAccessor,
+    format: openvds.VolumeDataChannelDescriptor.Format,
+    value: Any,
+    workers: int = 1,
+    max_pages: int = None,
+):
+    """fills writable page buffers in place, OpenVDS stores constant pages without their samples"""
+    _run_on_chunks(accessor, workers, max_pages, _fill_chunks, value, FORMAT2NPTYPE[format])
+
+
+def write_nan_pages(
+    accessor: openvds.core.VolumeDataPageAccessor,
+    format: openvds.VolumeDataChannelDescriptor.Format,
+    workers: int = 1,
+):
+    write_constant_pages(accessor, format, np.nan, workers=workers)
 
 
 def write_zero_pages(
     accessor: openvds.core.VolumeDataPageAccessor,
-    format: openvds.VolumeDataChannelDescriptor.Format
+    format: openvds.VolumeDataChannelDescriptor.Format,
+    workers: int = 1,
 ):
-    dtype = FORMAT2NPTYPE[format]
-    for c in range(accessor.getChunkCount()):
-        page = accessor.createPage(c)
-        buf = np.array(page.getWritableBuffer(), copy=False, dtype=dtype)
-        buf[:, :, :] = np.zeros(buf.shape, dtype=dtype)
-        page.release()
-    accessor.commit()
+    write_constant_pages(accessor, format, 0, workers=workers)
 
 
 INITVALUE = {
@@ -138,6 +274,7 @@ def create_vds(
     default_max_pages: int = 8,
     channels_data=None,
     init_value: InitValue = InitValue.zero,
+    workers: int = None,
 ):
     (
         layout_descriptor,
@@ -173,11 +310,11 @@ def create_vds(
             accessor = access_manager.createVolumeDataPageAccessor(
                 dimensionsND=channel.dimensions_nd.value,
                 accessMode=AccessModes.Create.value,
-                lod=lod,
+                lod=0,
                 channel=i,
                 maxPages=default_max_pages,
             )
-            write_pages(accessor, data, channel.format.value)
+            write_pages(accessor, data, channel.format.value, workers=workers)
 
     if init_value != InitValue.omit_init:
         for i in range(len(channels)):
@@ -185,10 +322,10 @@ def create_vds(
             accessor = access_manager.createVolumeDataPageAccessor(
                 dimensionsND=channel.dimensions_nd.value,
                 accessMode=access_mode,
-                lod=lod,
+                lod=0,
                 channel=i,
                 maxPages=default_max_pages,
             )
-            INITVALUE[init_value](accessor, channel.format.value)
+            INITVALUE[init_value](accessor, channel.format.value, workers=workers)
 
     return vds
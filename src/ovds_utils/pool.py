@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import count
+from threading import Condition, RLock
+from typing import Any, Dict, Iterator, List, Tuple
+from weakref import WeakValueDictionary
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.logging import get_logger
+from ovds_utils.ovds import AccessModes
+from ovds_utils.vds import VDS
+
+logger = get_logger(__name__)
+
+
+class VDSPool:
+    """Process-wide cache of open VDS sources shared by reference counting.
+
+    ``get`` hands out the same ``VDS`` for a path, connection string, access mode and options
+    until it is evicted. At most ``max_open`` sources are kept open, least recently used sources
+    that are not referenced are closed first. ``max_open=None`` never evicts. Sources are opened
+    outside the pool lock, concurrent misses on different sources do not wait for each other.
+    """
+
+    def __init__(self, max_open: int = 16, **options) -> None:
+        self.max_open = max_open
+        self.options = options
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Tuple, VDS] = OrderedDict()
+        self._refs: Dict[Tuple, int] = {}
+        self._keys: Dict[int, Tuple] = {}
+        self._opening = set()
+        self._lock = RLock()
+        self._opened = Condition(self._lock)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(open={len(self)}, max_open={self.max_open})>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            open=len(self._entries),
+            referenced=sum(1 for c in self._refs.values() if c),
+        )
+
+    def get(
+        self,
+        path: str,
+        connection_string: str = "",
+        mode: AccessModes = AccessModes.ReadOnly,
+        **options
+    ) -> VDS:
+        """returns shared VDS and takes a reference that is given back with release"""
+        if mode not in {AccessModes.ReadOnly, AccessModes.ReadWrite, AccessModes.ReadWriteWithoutLODGeneration}:
+            raise VDSException(f"Pool cannot open VDS sources with access mode {mode.name}")
+        options = {**self.options, **options}
+        # options may hold dicts, sources opened with different options are kept apart by their repr
+        key = (path, connection_string, mode, tuple(sorted((k, repr(v)) for k, v in options.items())))
+        with self._lock:
+            while key in self._opening:
+                self._opened.wait()
+            vds = self._entries.get(key)
+            if vds is not None and not vds.closed:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                self._refs[key] += 1
+                return vds
+            self.misses += 1
+            self._opening.add(key)
+
+        try:
+            logger.debug(f"Opening pooled VDS {path}")
+            vds = VDS(path, connection_string, access_mode=mode, **options)
+        finally:
+            with self._lock:
+                self._opening.discard(key)
+                self._opened.notify_all()
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = vds
+            self._refs[key] = 1
+            self._keys[id(vds)] = key
+            evicted = self._evict()
+        self._close(evicted)
+        return vds
+
+    def release(self, vds: VDS):
+        with self._lock:
+            key = self._keys.get(id(vds))
+            if self._refs.get(key, 0) <= 0:
+                raise VDSException(f"VDS {vds.path} is not referenced in the pool")
+            self._refs[key] -= 1
+            evicted = self._evict()
+        self._close(evicted)
+
+    @contextmanager
+    def handle(
+        self,
+        path: str,
+        connection_string: str = "",
+        mode: AccessModes = AccessModes.ReadOnly,
+        **options
+    ) -> Iterator[VDS]:
+        vds = self.get(path, connection_string, mode, **options)
+        try:
+            yield vds
+        finally:
+            self.release(vds)
+
+    def _drop(self, key: Tuple) -> VDS:
+        vds = self._entries.pop(key, None)
+        self._refs.pop(key, None)
+        if vds is not None:
+            self._keys.pop(id(vds), None)
+        return vds
+
+    def _evict(self) -> List[VDS]:
+        """removes least recently used unreferenced sources, they are closed by the caller outside the lock"""
+        if self.max_open is None or len(self._entries) <= self.max_open:
+            return []
+        evicted = []
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_open:
+                break
+            if self._refs.get(key):
+                continue
+            evicted.append(self._drop(key))
+            self.evictions += 1
+        if len(self._entries) > self.max_open:
+            logger.debug(f"VDS pool exceeds {self.max_open} open sources because of referenced sources")
+        return evicted
+
+    @staticmethod
+    def _close(evicted: List[VDS]):
+        for vds in evicted:
+            vds.close()
+
+    def forget(self):
+        """drops sources without closing them, used for sources inherited from a forked parent"""
+        with self._lock:
+            for vds in self._entries.values():
+                vds.closed = True
+            self._entries.clear()
+            self._refs.clear()
+            self._keys.clear()
+
+    def close(self):
+        with self._lock:
+            for vds in self._entries.values():
+                vds.close()
+            self._entries.clear()
+            self._refs.clear()
+            self._keys.clear()
+
+
+_SHARED = VDSPool(max_open=None)
+_PID = os.getpid()
+_LOCK = RLock()
+_ORIGINALS: WeakValueDictionary[int, VDS] = WeakValueDictionary()
+_TOKENS = count()
+
+
+def share_token(vds: VDS) -> Tuple[int, int]:
+    """returns token under which unpickling in this process finds vds while it is open"""
+    with _LOCK:
+        if getattr(vds, "_share_token", None) is None:
+            vds._share_token = next(_TOKENS)
+            _ORIGINALS[vds._share_token] = vds
+        return os.getpid(), vds._share_token
+
+
+def open_shared(descriptor: Dict[str, Any], token: Tuple[int, int] = None) -> VDS:
+    """returns VDS of this process opened from a descriptor, opening it on first use
+
+    In the process that pickled the VDS the original is returned while it is open, it may
+    hold pages that are not flushed yet and a new handle would not see them.
+    """
+    global _PID
+    options = dict(descriptor)
+    path = options.pop("path")
+    connection_string = options.pop("connection_string")
+    mode = options.pop("access_mode")
+    with _LOCK:
+        if token is not None and token[0] == os.getpid():
+            original = _ORIGINALS.get(token[1])
+            if original is not None and not original.closed:
+                return original
+        if _PID != os.getpid():
+            # handles inherited from a forked parent belong to the parent
+            _SHARED.forget()
+            _PID = os.getpid()
+        # unpickled handles are not released explicitly, the shared pool never evicts
+        vds = _SHARED.get(path, connection_string, mode, **options)
+        _SHARED.release(vds)
+        return vds
+
+
+def close_shared():
+    """closes VDS sources opened by open_shared in this process"""
+    _SHARED.close()
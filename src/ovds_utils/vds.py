@@ -1,49 +1,129 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import List, Sequence, Tuple, Union
+import asyncio
+from bisect import bisect_right
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+from functools import reduce
+from itertools import product
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
 
 import numpy as np
 import openvds
 
-from ovds_utils.exceptions import VDSException
+from ovds_utils.cache import InfoCache, PageCache
+from ovds_utils.exceptions import VDSException, VDSMetadataException, VDSRequestException
+from ovds_utils.geometry import ChunkGeometry
 from ovds_utils.logging import get_logger
-from ovds_utils.metadata import MetadataContainer
-from ovds_utils.ovds import (LOD, AccessModes, BrickSizes, Components, Dimensions, Formats, InitValue, Options,
-                             create_vds)
-from ovds_utils.ovds.utils import get_vds_info
+from ovds_utils.metadata import LayoutMetadataValue, MetadataContainer
+from ovds_utils.ovds import (LOD, METADATATYPE_TO_OVDS_GET_FUNCTION, AccessModes, BrickSizes, Components, Dimensions,
+                             Formats, InitValue, MemmapSource, Options, create_vds)
+from ovds_utils.ovds.utils import get_vds_info, get_vds_info_from_layout
 from ovds_utils.ovds.writing import FORMAT2NPTYPE
 
 logger = get_logger(__name__)
 
+READ_ENGINES = ("subset", "bricks")
+INTERPOLATIONS = ("nearest", "linear", "cubic")
+CHANNEL_LAYOUTS = ("stack", "dict", "structured")
+
+
+def normalize_key(key, shape: Sequence[int]) -> Tuple[List[range], List[bool], List[bool]]:
+    """returns ascending sample ranges per axis with flags of int indexed and reversed axes"""
+    if not isinstance(key, (tuple, list)):
+        key = (key,)
+    if sum(k is Ellipsis for k in key) > 1:
+        raise VDSException("Item key can only have a single Ellipsis")
+    if Ellipsis in key:
+        i = key.index(Ellipsis)
+        key = tuple(key[:i]) + (slice(None),) * (len(shape) - len(key) + 1) + tuple(key[i+1:])
+    if len(key) > len(shape):
+        raise VDSException(f"Too many indices for VDS of shape {tuple(shape)}")
+    key = tuple(key) + (slice(None),) * (len(shape) - len(key))
+
+    ranges, squeeze, flip = [], [], []
+    for k, n in zip(key, shape):
+        if isinstance(k, (int, np.integer)):
+            i = int(k) + n if k < 0 else int(k)
+            if not 0 <= i < n:
+                raise VDSException(f"Index {k} is out of range of: 0 to {n-1}")
+            ranges.append(range(i, i + 1))
+            squeeze.append(True)
+            flip.append(False)
+        elif isinstance(k, slice):
+            r = range(*k.indices(n))
+            flip.append(r.step < 0)
+            ranges.append(r[::-1] if r.step < 0 else r)
+            squeeze.append(False)
+        else:
+            raise VDSException("Item key is not list of slices or int")
+    return ranges, squeeze, flip
+
+
+def sampled_overlap(r: range, lo: int, hi: int) -> Union[Tuple[slice, slice], None]:
+    """returns (source slice relative to lo, output slice) of indices of r within lo to hi"""
+    last = r[-1]
+    k0 = -(-(max(lo, r.start) - r.start) // r.step)
+    k1 = -(-(min(hi, last + 1) - r.start) // r.step)
+    if k0 >= k1:
+        return None
+    return slice(r[k0] - lo, r[k1 - 1] - lo + 1, r.step), slice(k0, k1)
+
 
 class VDSChunk:
     def __init__(
         self,
         number: int,
         accessor: openvds.core.VolumeDataPageAccessor,
-        format: Formats
+        format: Formats,
+        cache: PageCache = None,
+        channel: int = 0,
+        lod: int = 0,
+        geometry: ChunkGeometry = None,
     ) -> None:
         super().__init__()
         self.is_released = False
+        self.geometry = geometry
         self.number = number
         self.accesor = accessor
         self._page = None
+        self._existing = False
         self.format = format
+        self.cache = cache
+        self.channel = channel
+        self.lod = lod
 
     def __repr__(self) -> str:
         return f"<VDSChunk(number={self.number})>"
 
-    def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        return (self.channel, self.lod, self.number)
+
+    def _read_page(self) -> Tuple[openvds.core.VolumeDataPage, np.array]:
         dtype = FORMAT2NPTYPE[self.format.value]
         page = self.accesor.readPage(self.number)
-        buf = np.array(page.getBuffer(), copy=False, dtype=dtype)
-        return buf.__getitem__(key)
+        return page, np.array(page.getBuffer(), copy=False, dtype=dtype)
+
+    def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
+        if self.cache is None:
+            page, buf = self._read_page()
+            result = buf.__getitem__(key).copy()
+            page.release()
+            return result
+        with self.cache.pinned(self.key, self._read_page) as buf:
+            return buf.__getitem__(key).copy()
 
     def __setitem__(self, key: Sequence[Union[int, slice]], value: np.array):
         dtype = FORMAT2NPTYPE[self.format.value]
         buf = np.array(self.page.getWritableBuffer(), copy=False, dtype=dtype)
-        return buf.__setitem__(key, value)
+        if self.cache is not None:
+            self.cache.discard(self.key)
+        buf.__setitem__(key, value)
+        if self._existing:
+            # pages that were read instead of created are written back only with a written region
+            self.page.updateWrittenRegion(*self.page.getMinMax())
 
     def release(self) -> None:
         self.page.release()
@@ -57,12 +137,15 @@ class VDSChunk:
             except openvds.core.InvalidOperation as e:
                 if e.args[0] == "Cannot create a page that already exists":
                     self._page = self.accesor.readPage(self.number)
+                    self._existing = True
                 else:
                     raise e
         return self._page
 
     @property
     def minmax(self) -> Tuple[Sequence[int]]:
+        if self.geometry is not None:
+            return self.geometry.bounds(self.number)
         _min, _max = self.page.getMinMax()
         _min = _min[:3][::-1]
         _max = _max[:3][::-1]
@@ -78,11 +161,19 @@ class VDSChunksGenerator:
         self,
         chunks_count: int,
         accessor: openvds.core.VolumeDataPageAccessor,
-        format: Formats
+        format: Formats,
+        cache: PageCache = None,
+        channel: int = 0,
+        lod: int = 0,
+        geometry: ChunkGeometry = None,
     ) -> None:
         self.chunks_count = chunks_count
         self.accessor = accessor
         self.format = format
+        self.cache = cache
+        self.channel = channel
+        self.lod = lod
+        self.geometry = geometry
 
     def __iter__(self):
         self.n = 0
@@ -91,7 +182,13 @@ class VDSChunksGenerator:
     def __next__(self):
         if self.n < self.chunks_count:
             chunk = VDSChunk(
-                number=self.n, accessor=self.accessor, format=self.format
+                number=self.n,
+                accessor=self.accessor,
+                format=self.format,
+                cache=self.cache,
+                channel=self.channel,
+                lod=self.lod,
+                geometry=self.geometry,
             )
             self.n += 1
             return chunk
@@ -99,6 +196,98 @@ class VDSChunksGenerator:
             raise StopIteration
 
 
+class VDSRequest:
+    """Future-like handle of a pending ``requestVolumeSubset`` call.
+
+    Can be waited on with ``result()`` or awaited inside a coroutine, awaiting waits for the
+    request in the loop's default executor and cancels the request when the awaiting task is
+    cancelled.
+    """
+
+    def __init__(
+        self,
+        request: openvds.volumedataaccess.VolumeDataRequest,
+        access_manager: openvds.VolumeDataAccessManager,
+        shape: Sequence[int],
+        key: Tuple[Union[int, slice]] = None,
+        out: np.array = None,
+    ) -> None:
+        self._request = request
+        self._access_manager = access_manager
+        self.shape = tuple(shape)
+        self.key = key
+        self.out = out
+        self._result = None
+
+    def __repr__(self) -> str:
+        return f"<VDSRequest(shape={self.shape}, done={self.done()})>"
+
+    def done(self) -> bool:
+        return self._result is not None or self._request.isCompleted or self._request.isCanceled
+
+    def cancelled(self) -> bool:
+        return self._result is None and self._request.isCanceled and not self.error[0]
+
+    def cancel(self) -> bool:
+        if self.done():
+            return False
+        self._request.cancelAndWaitForCompletion()
+        return self._request.isCanceled
+
+    @property
+    def error(self) -> Tuple[int, str]:
+        if hasattr(self._access_manager, "getCurrentDownloadError"):
+            return self._access_manager.getCurrentDownloadError()
+        return self._request.errorCode, self._request.errorMessage
+
+    def exception(self, timeout: float = None) -> Union[Exception, None]:
+        try:
+            self.result(timeout)
+        except VDSRequestException as e:
+            return e
+        return None
+
+    def result(self, timeout: float = None) -> np.array:
+        if self._result is not None:
+            return self._result
+
+        if timeout is not None and timeout <= 0:
+            # polls without blocking, OpenVDS waits forever for a zero timeout
+            completed = self._request.isCompleted
+        else:
+            # timeouts below one millisecond would round to zero milliseconds
+            completed = self._request.waitForCompletion(0.0 if timeout is None else max(timeout, 0.001))
+        if not completed:
+            if not self._request.isCanceled:
+                raise FuturesTimeoutError(f"Request was not completed within {timeout}s")
+            err_code, err_msg = self.error
+            if not err_code:
+                raise CancelledError("Request was canceled")
+            logger.error(err_code)
+            logger.error(err_msg)
+            raise VDSRequestException(f"requestVolumeSubset failed! Message: {err_msg}, Error Code: {err_code}")
+
+        data = self._request.data_out.reshape(*self.shape)
+        if self.key is not None:
+            data = data.__getitem__(self.key)
+        if self.out is not None:
+            if not np.shares_memory(data, self.out):
+                np.copyto(self.out, data)
+            data = self.out
+        self._result = data
+        return self._result
+
+    def __await__(self):
+        if not self.done():
+            loop = asyncio.get_running_loop()
+            try:
+                yield from loop.run_in_executor(None, self._request.waitForCompletion, 0.0).__await__()
+            except asyncio.CancelledError:
+                self.cancel()
+                raise
+        return self.result()
+
+
 class Axis:
     def __init__(
         self,
@@ -132,8 +321,41 @@ class Channel:
             vds_source=None,
             shape: Sequence[int] = None,
             dimensions_nd=Dimensions._012,
+            access_manager: openvds.VolumeDataAccessManager = None,
+            index: int = 0,
+            page_cache: PageCache = None,
+            no_value: float = None,
+            read_engine: str = "subset",
+            workers: int = None,
+            lod_levels: int = 0,
+            lod: int = 0,
+            lod0_shape: Sequence[int] = None,
+            access_mode: AccessModes = AccessModes.ReadOnly,
+            max_pages: int = 8,
+            chunk_metadata_page_size: int = 1024,
+            brick_size: int = None,
     ) -> None:
+        if read_engine not in READ_ENGINES:
+            raise VDSException(f"Read engine {read_engine} was not recognized among: {', '.join(READ_ENGINES)}")
+        self.read_engine = read_engine
+        self.workers = workers
+        self.lod_levels = lod_levels
+        self.lod = lod
+        self.lod0_shape = lod0_shape if lod0_shape is not None else shape
+        # samples per brick along every axis taken from the layout, used without building the geometry
+        self.brick_size = brick_size
+        # the page accessor is created on first use with these settings
+        self.access_mode = access_mode
+        self.max_pages = max_pages
+        self.chunk_metadata_page_size = chunk_metadata_page_size
+        self._executor = None
+        self._pages_written = False
         self._vds_source = vds_source
+        self._access_manager = access_manager
+        self.index = index
+        self.page_cache = page_cache
+        self.no_value = no_value
+        self._geometry = None
         self.name = name
         self.format = format
         self.unit = unit
@@ -146,87 +368,527 @@ class Channel:
         self.dimensions_nd = dimensions_nd
 
     def __repr__(self) -> str:
+        if self.lod:
+            return f"<Channel(name={self.name}, unit={self.unit}, format={self.format.name}, lod={self.lod})>"
         return f"<Channel(name={self.name}, unit={self.unit}, format={self.format.name})>"
 
+    @property
+    def accessor(self) -> openvds.core.VolumeDataPageAccessor:
+        if self._accessor is None and self._vds_source is not None:
+            self._accessor = self._create_accessor()
+        return self._accessor
+
+    @accessor.setter
+    def accessor(self, accessor: openvds.core.VolumeDataPageAccessor):
+        self._accessor = accessor
+
+    def _create_accessor(self) -> openvds.core.VolumeDataPageAccessor:
+        logger.debug(f"Creating page accessor of channel {self.name} at LOD {self.lod}")
+        return self.access_manager.createVolumeDataPageAccessor(
+            dimensionsND=self.dimensions_nd.value,
+            accessMode=self.access_mode.value,
+            lod=self.lod,
+            channel=self.index,
+            maxPages=self.max_pages,
+            chunkMetadataPageSize=self.chunk_metadata_page_size,
+        )
+
+    @property
+    def geometry(self) -> ChunkGeometry:
+        if self._geometry is None:
+            self._geometry = ChunkGeometry.from_accessor(self.accessor, self.lod)
+        return self._geometry
+
     def chunks(self) -> VDSChunksGenerator:
-        return VDSChunksGenerator(chunks_count=self.chunks_count, accessor=self.accessor, format=self.format)
+        return VDSChunksGenerator(
+            chunks_count=self.geometry.count,
+            accessor=self.accessor,
+            format=self.format,
+            cache=self.page_cache,
+            channel=self.index,
+            lod=self.lod,
+            geometry=self.geometry,
+        )
 
     def get_chunk(self, number: int) -> VDSChunk:
-        if number not in set(range(self.chunks_count)):
-            raise VDSException(f"Chunk number is out of range of: 0 to {self.chunks_count-1}")
+        self.geometry.check(number)
         return VDSChunk(
-            number=number, accessor=self.accessor, format=self.format
+            number=number,
+            accessor=self.accessor,
+            format=self.format,
+            cache=self.page_cache,
+            channel=self.index,
+            lod=self.lod,
+            geometry=self.geometry,
         )
 
-    def _read_data(
+    def _find_chunk(self, begin: Sequence[int], end: Sequence[int]) -> Union[int, None]:
+        """returns number of the chunk containing the whole region or None"""
+        chunk = self.geometry.chunk_at(begin)
+        if all(e <= m for e, m in zip(end, self.geometry.inner_maxs[chunk])):
+            return chunk
+        return None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _single_brick(self, begin: Sequence[int], end: Sequence[int]) -> bool:
+        """checks whether the region lies inside one brick"""
+        if any(e <= b for b, e in zip(begin, end)):
+            return False
+        if self.brick_size is None:
+            return self._find_chunk(begin, end) is not None
+        return all(b // self.brick_size == (e - 1) // self.brick_size for b, e in zip(begin, end))
+
+    def _locate_chunk(self, coordinate: Sequence[int]) -> Tuple[int, Sequence[int]]:
+        """returns number and margin inclusive mins of the chunk holding coordinate"""
+        if self._geometry is not None or self.brick_size is None:
+            chunk = self.geometry.chunk_at(coordinate)
+            return chunk, self.geometry.mins[chunk]
+        # asks OpenVDS for one chunk instead of building the geometry of all of them
+        factor = 1 << self.lod
+        chunk = self.accessor.getChunkIndex([c * factor for c in coordinate[::-1]] + [0] * len(coordinate))
+        _min, _ = self.accessor.getChunkMinMax(chunk)
+        return chunk, [m // factor for m in _min[2::-1]]
+
+    def _copy_chunk(
+        self,
+        chunk: int,
+        begin: Sequence[int],
+        end: Sequence[int],
+        out: np.array,
+        offset: Sequence[int],
+        mins: Sequence[int] = None,
+    ):
+        mins = self.geometry.mins[chunk] if mins is None else mins
+        src = tuple(slice(b - m, e - m) for b, e, m in zip(begin, end, mins))
+        dst = tuple(slice(b - o, e - o) for b, e, o in zip(begin, end, offset))
+        with self._page(chunk) as buf:
+            out.__setitem__(dst, buf.__getitem__(src))
+
+    @contextmanager
+    def _page(self, number: int) -> Iterator[np.array]:
+        chunk = VDSChunk(
+            number=number,
+            accessor=self.accessor,
+            format=self.format,
+            cache=self.page_cache,
+            channel=self.index,
+            lod=self.lod,
+            geometry=self._geometry,
+        )
+        if self.page_cache is not None:
+            with self.page_cache.pinned(chunk.key, chunk._read_page) as buf:
+                yield buf
+            return
+        page, buf = chunk._read_page()
+        try:
+            yield buf
+        finally:
+            page.release()
+
+    def _copy_sampled(self, chunk: int, groups: Sequence[Tuple[np.array, slice]], out: np.array):
+        src = np.ix_(*[idx - m for (idx, _), m in zip(groups, self.geometry.mins[chunk])])
+        dst = tuple(s for _, s in groups)
+        with self._page(chunk) as buf:
+            out.__setitem__(dst, buf.__getitem__(src))
+
+    def _read_strided(self, ranges: Sequence[range]) -> np.array:
+        """copies sampled indices from pages of the chunks that contain at least one of them"""
+        out = np.empty([len(r) for r in ranges], dtype=FORMAT2NPTYPE[self.format.value])
+        axes = []
+        for r, brick_size in zip(ranges, self.geometry.brick_size):
+            idx = np.arange(r.start, r.stop, r.step)
+            bricks = idx // brick_size
+            groups = []
+            for b in np.unique(bricks):
+                sel = np.flatnonzero(bricks == b)
+                groups.append((int(b), idx[sel], slice(int(sel[0]), int(sel[-1]) + 1)))
+            axes.append(groups)
+        plan = [
+            (int(self.geometry.grid[a[0], b[0], c[0]]), [g[1:] for g in (a, b, c)])
+            for a, b, c in product(*axes)
+        ]
+        futures = [self.executor.submit(self._copy_sampled, c, groups, out) for c, groups in plan]
+        for f in futures:
+            f.result()
+        return out
+
+    def _lod_for(self, ranges: Sequence[range]) -> int:
+        """returns the coarsest LOD level holding every sampled index, LOD k keeps every 2**k-th sample"""
+        for lod in range(self.lod_levels - self.lod, 0, -1):
+            factor = 1 << lod
+            if all(r.start % factor == 0 and (len(r) == 1 or r.step % factor == 0) for r in ranges):
+                return lod
+        return 0
+
+    def _read_bricks(
+        self,
+        begin: Sequence[int],
+        end: Sequence[int],
+        key: Tuple[Union[int, slice]] = None,
+        out: np.array = None,
+    ) -> np.array:
+        """assembles the region from cached pages of every intersecting chunk"""
+        if out is None:
+            out = np.empty([e - b for b, e in zip(begin, end)], dtype=FORMAT2NPTYPE[self.format.value])
+        if self._single_brick(begin, end):
+            chunk, mins = self._locate_chunk(begin)
+            self._copy_chunk(chunk, begin, end, out, begin, mins)
+            return out if key is None else out.__getitem__(key)
+        plan = self.geometry.intersecting(begin, end)
+        if len(plan) == 1:
+            self._copy_chunk(*plan[0], out, begin)
+        else:
+            futures = [self.executor.submit(self._copy_chunk, *p, out, begin) for p in plan]
+            for f in futures:
+                f.result()
+        if key is not None:
+            return out.__getitem__(key)
+        return out
+
+    @property
+    def access_manager(self) -> openvds.VolumeDataAccessManager:
+        if self._access_manager is None:
+            if self._vds_source is None:
+                raise VDSException(f"Channel {self.name} is not attached to an open VDS source.")
+            self._access_manager = openvds.VolumeDataAccessManager(self._vds_source)
+        return self._access_manager
+
+    def _request_data(
         self,
         vds_source: openvds.core.VDS,
         begin: Sequence[int],
         end: Sequence[int],
         lod: int = 0,
         replacementNoValue: float = 0.0,
-        channel: int = 0
-    ):
-        begin = begin[::-1] + ([0]*len(begin))
-        end = end[::-1] + ([1]*len(end))
-
-        dims = (
-            end[2] - begin[2],
-            end[1] - begin[1],
-            end[0] - begin[0],
-        )
-        accessManager = openvds.VolumeDataAccessManager(vds_source)
+        channel: int = None,
+        key: Tuple[Union[int, slice]] = None,
+        out: np.array = None,
+    ) -> VDSRequest:
+        channel = self.index if channel is None else channel
+        # OpenVDS takes coordinates in LOD 0 samples and returns every 2**lod-th sample,
+        # begin and end are samples of this channel's LOD and lod adds further levels
+        factor = 1 << self.lod
+        begin = [b * factor for b in begin[::-1]] + ([0]*len(begin))
+        end = [min(e * factor, n) for e, n in zip(end[::-1], self.lod0_shape[::-1])] + ([1]*len(end))
+        lod += self.lod
+
+        dims = tuple(-(-(end[i] - begin[i]) // (1 << lod)) for i in (2, 1, 0))
+        if vds_source is self._vds_source:
+            accessManager = self.access_manager
+        else:
+            accessManager = openvds.VolumeDataAccessManager(vds_source)
+        # OpenVDS decodes straight into out when it is a C-contiguous buffer of the channel format
+        # covering the whole request, other arrays get the result copied in once the request completes.
+        # Flipped keys are reversed views of the decoded buffer, so they can not be decoded into out.
+        data_out = None
+        flipped = any(isinstance(k, slice) and (k.step or 1) < 0 for k in key or ())
+        if (
+            out is not None and out.flags.c_contiguous and out.dtype == FORMAT2NPTYPE[self.format.value]
+            and out.size == np.prod(dims) and not flipped
+        ):
+            data_out = out
         req = accessManager.requestVolumeSubset(
             begin,  # start slice
             end,  # end slice
+            data_out=data_out,
             format=self.format.value,
             lod=lod,
             replacementNoValue=replacementNoValue,
             channel=channel,
         )
+        return VDSRequest(req, accessManager, dims, key, out)
+
+    def _read_data(
+        self,
+        vds_source: openvds.core.VDS,
+        begin: Sequence[int],
+        end: Sequence[int],
+        lod: int = 0,
+        replacementNoValue: float = 0.0,
+        channel: int = None
+    ):
+        return self._request_data(vds_source, begin, end, lod, replacementNoValue, channel).result()
+
+    def _normalize_key(self, key) -> Tuple[List[range], List[bool], List[bool]]:
+        return normalize_key(key, self.shape)
+
+    @staticmethod
+    def _post_key(
+        squeeze: Sequence[bool],
+        flip: Sequence[bool],
+        steps: Sequence[int]
+    ) -> Union[Tuple[Union[int, slice]], None]:
+        if not any(squeeze) and not any(flip) and all(s == 1 for s in steps):
+            return None
+        return tuple(
+            0 if sq else slice(None, None, -step if fl else step)
+            for sq, fl, step in zip(squeeze, flip, steps)
+        )
 
-        if req.data is None:
-            err_code, err_msg = accessManager.getCurrentDownloadError()
-            logger.exception(err_code)
-            logger.exception(err_msg)
-            raise RuntimeError(f"requestVolumeSubset failed! Message: {err_msg}, Error Code: {err_code}")
+    def _parse_key(self, key: Sequence[Union[int, slice]]) -> Tuple[List[int], List[int], Tuple[Union[int, slice]]]:
+        ranges, squeeze, flip = self._normalize_key(key)
+        begin = [r.start for r in ranges]
+        end = [r[-1] + 1 if len(r) else r.start for r in ranges]
+        return begin, end, self._post_key(squeeze, flip, [r.step for r in ranges])
 
-        return req.data.reshape(*dims)
+    def read_async(self, key: Sequence[Union[int, slice]], out: np.array = None) -> VDSRequest:
+        begin, end, post_key = self._parse_key(key)
+        if out is not None:
+            self._check_out(*self._normalize_key(key)[:2], out)
+        return self._request_data(self._vds_source, begin, end, key=post_key, out=out)
+
+    @staticmethod
+    def _check_out(ranges: Sequence[range], squeeze: Sequence[bool], out: np.array):
+        expected = tuple(len(r) for r, sq in zip(ranges, squeeze) if not sq)
+        if tuple(out.shape) != expected:
+            raise VDSException(f"Output array shape {out.shape} does not match requested shape {expected}")
+
+    def read_into(self, key: Sequence[Union[int, slice]], out: np.array) -> np.array:
+        """reads key into preallocated out array without allocating a full size result"""
+        ranges, squeeze, flip = self._normalize_key(key)
+        self._check_out(ranges, squeeze, out)
+        begin, end, post_key = self._parse_key(key)
+        if all(r.step == 1 for r in ranges) and not any(flip) and self._use_bricks(begin, end):
+            region = out.__getitem__(tuple(None if sq else slice(None) for sq in squeeze))
+            self._read_bricks(begin, end, out=region)
+            return out
+        if any(r.step > 1 for r in ranges) and all(len(r) for r in ranges):
+            np.copyto(out, self._read_stepped(ranges, squeeze, flip))
+            return out
+        return self._request_data(self._vds_source, begin, end, key=post_key, out=out).result()
 
     def _getitem_for_whole_dataset(self, key: Sequence[Union[int, slice]]) -> np.array:
-        is_int = False
-        if all([isinstance(i, int) for i in key]):
-            begin = [i for i in key]
-            end = [i+1 for i in key]
-            return self._read_data(self._vds_source, begin, end).__getitem__(tuple(0 for i in key))
-        elif all([isinstance(i, int) or isinstance(i, slice) for i in key]):
-            begin = []
-            end = []
-            for i, k in enumerate(key):
-                if isinstance(k, slice):
-                    begin.append(k.start if k.start else 0)
-                    end.append(k.stop if k.stop else self.shape[i])
-                elif isinstance(k, int):
-                    is_int = True
-                    begin.append(k)
-                    end.append(k+1)
-        else:
-            raise VDSException("Item key is not list of slices or int")
+        return self.read_async(key).result()
 
-        if is_int:
-            return self._read_data(self._vds_source, begin, end).__getitem__(
-                tuple(
-                    slice(None, None) if isinstance(i, slice) else 0 for i in key
-                )
+    def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
+        ranges, squeeze, flip = self._normalize_key(key)
+        if any(len(r) == 0 for r in ranges):
+            return np.empty(
+                [len(r) for r, sq in zip(ranges, squeeze) if not sq], dtype=FORMAT2NPTYPE[self.format.value]
             )
+        if any(r.step > 1 for r in ranges):
+            return self._read_stepped(ranges, squeeze, flip)
+        begin, end, post_key = self._parse_key(key)
+        if self._use_bricks(begin, end):
+            return self._read_bricks(begin, end, post_key)
+        return self._request_data(self._vds_source, begin, end, key=post_key).result()
+
+    def _read_stepped(self, ranges: Sequence[range], squeeze: Sequence[bool], flip: Sequence[bool]) -> np.array:
+        """serves stepped keys from a LOD level or from the bricks holding sampled indices"""
+        begin = [r.start for r in ranges]
+        end = [r[-1] + 1 for r in ranges]
+        lod = self._lod_for(ranges)
+        if lod:
+            post_key = self._post_key(squeeze, flip, [max(r.step >> lod, 1) for r in ranges])
+            return self._request_data(self._vds_source, begin, end, lod=lod, key=post_key).result()
+        if self.accessor is not None and self.no_value is None:
+            data = self._read_strided(ranges)
+            post_key = self._post_key(squeeze, flip, [1] * len(ranges))
+            return data if post_key is None else data.__getitem__(post_key)
+        post_key = self._post_key(squeeze, flip, [r.step for r in ranges])
+        return self._request_data(self._vds_source, begin, end, key=post_key).result()
+
+    def _sample_range(self, sample_range: Union[slice, Tuple[int, int], None]) -> Tuple[int, int]:
+        if sample_range is None:
+            return 0, self.shape[2]
+        if isinstance(sample_range, slice):
+            if sample_range.step not in (None, 1):
+                raise VDSException("Sample range of traces does not support steps")
+            start, stop, _ = sample_range.indices(self.shape[2])
         else:
-            return self._read_data(self._vds_source, begin, end)
+            start, stop = sample_range
+        if not 0 <= start < stop <= self.shape[2]:
+            raise VDSException(f"Sample range ({start}, {stop}) is out of range of: 0 to {self.shape[2]}")
+        return start, stop
 
-    def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
-        return self._getitem_for_whole_dataset(key)
+    def _copy_traces(
+        self,
+        bricks: Sequence[Tuple[int, int, int]],
+        rows: np.array,
+        coords: np.array,
+        start: int,
+        out: np.array,
+    ):
+        for chunk, z0, z1 in bricks:
+            m = self.geometry.mins[chunk]
+            with self._page(chunk) as buf:
+                out[rows, z0 - start:z1 - start] = buf[coords[:, 0] - m[0], coords[:, 1] - m[1], z0 - m[2]:z1 - m[2]]
+
+    def read_traces(self, coords: np.array, sample_range: Union[slice, Tuple[int, int]] = None) -> np.array:
+        """reads traces along the last axis at (N, 2) coordinates of the first two axes, each brick is read once"""
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+        start, stop = self._sample_range(sample_range)
+        for d in range(2):
+            if len(coords) and not (0 <= coords[:, d].min() and coords[:, d].max() < self.shape[d]):
+                raise VDSException(f"Trace coordinates are out of range of: {tuple(self.shape[:2])}")
+        out = np.empty((len(coords), stop - start), dtype=FORMAT2NPTYPE[self.format.value])
+        if self.accessor is None or self.no_value is not None:
+            for n, (i, j) in enumerate(coords):
+                self.read_into((int(i), int(j), slice(start, stop)), out[n])
+            return out
+
+        geometry = self.geometry
+        size = geometry.brick_size[2]
+        z_bricks = [
+            (b, max(start, b * size), min(stop, (b + 1) * size))
+            for b in range(start // size, (stop - 1) // size + 1)
+        ]
+        # traces in the same column of bricks are copied together, so every page is read once
+        columns, inverse = np.unique(coords // geometry.brick_size[:2], axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(columns) + 1))
+        futures = []
+        for n, (b0, b1) in enumerate(columns):
+            rows = order[bounds[n]:bounds[n + 1]]
+            bricks = [(int(geometry.grid[b0, b1, b]), z0, z1) for b, z0, z1 in z_bricks]
+            futures.append(self.executor.submit(self._copy_traces, bricks, rows, coords[rows], start, out))
+        for f in futures:
+            f.result()
+        return out
+
+    def _gather_chunk(self, chunk: int, rows: np.array, positions: np.array, out: np.array):
+        local = positions - self.geometry.mins[chunk]
+        with self._page(chunk) as buf:
+            out[rows] = buf[local[:, 0], local[:, 1], local[:, 2]]
+
+    def _gather(self, positions: np.array) -> np.array:
+        """reads samples at (M, 3) integer positions, positions are bucketed so every page is read once"""
+        geometry = self.geometry
+        out = np.empty(len(positions), dtype=FORMAT2NPTYPE[self.format.value])
+        bricks = positions // geometry.brick_size
+        chunks = geometry.grid[bricks[:, 0], bricks[:, 1], bricks[:, 2]]
+        order = np.argsort(chunks, kind="stable")
+        numbers, bounds = np.unique(chunks[order], return_index=True)
+        bounds = np.append(bounds, len(order))
+        futures = []
+        for n, chunk in enumerate(numbers):
+            rows = order[bounds[n]:bounds[n + 1]]
+            futures.append(self.executor.submit(self._gather_chunk, int(chunk), rows, positions[rows], out))
+        for f in futures:
+            f.result()
+        return out
+
+    @staticmethod
+    def _stencil(points: np.array, interpolation: str) -> Tuple[np.array, np.array]:
+        """returns sample offsets and weights of the interpolation kernel per point and axis"""
+        if interpolation == "nearest":
+            base = np.floor(points + 0.5)
+            return base[:, :, None].astype(np.int64), np.ones(points.shape + (1,))
+        base = np.floor(points)
+        t = (points - base)[:, :, None]
+        if interpolation == "linear":
+            offsets = np.arange(2)
+            weights = np.concatenate([1 - t, t], axis=2)
+        else:
+            # Catmull-Rom cubic convolution kernel
+            offsets = np.arange(-1, 3)
+            weights = np.concatenate([
+                ((-t + 2) * t - 1) * t / 2,
+                ((3 * t - 5) * t * t + 2) / 2,
+                ((-3 * t + 4) * t + 1) * t / 2,
+                (t - 1) * t * t / 2,
+            ], axis=2)
+        return base.astype(np.int64)[:, :, None] + offsets, weights
+
+    def sample(self, points: np.array, interpolation: str = "linear") -> np.array:
+        """samples the channel at (N, 3) fractional sample coordinates, results keep the order of points"""
+        if interpolation not in INTERPOLATIONS:
+            raise VDSException(
+                f"Interpolation {interpolation} was not recognized among: {', '.join(INTERPOLATIONS)}"
+            )
+        if self.accessor is None:
+            raise VDSException(f"Channel {self.name} is not attached to an open VDS source.")
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        limits = np.array(self.shape) - 1
+        if len(points) and ((points < 0).any() or (points > limits).any()):
+            raise VDSException(f"Sample points are out of range of: {tuple(self.shape)}")
+
+        indices, weights = self._stencil(points, interpolation)
+        indices = np.clip(indices, 0, limits[None, :, None])
+        k = indices.shape[2]
+        # every point needs the full k x k x k neighbourhood of samples
+        grid = np.stack(np.meshgrid(*[np.arange(k)] * 3, indexing="ij"), axis=-1).reshape(-1, 3)
+        positions = np.stack([indices[:, d, grid[:, d]] for d in range(3)], axis=-1)
+        values = self._gather(positions.reshape(-1, 3)).reshape(len(points), k, k, k)
+        if interpolation == "nearest":
+            return values.reshape(-1)
+        return np.einsum("nijk,ni,nj,nk->n", values, weights[:, 0], weights[:, 1], weights[:, 2])
+
+    def _use_bricks(self, begin: Sequence[int], end: Sequence[int]) -> bool:
+        if self.no_value is not None or (self._accessor is None and self._vds_source is None):
+            return False
+        if self.read_engine == "bricks" or self._pages_written:
+            return True
+        # single brick reads are served from pages only when pages are cached
+        return self.page_cache is not None and self._single_brick(begin, end)
 
     def commit(self):
-        self.accessor.commit()
+        if self._accessor is not None:
+            self._accessor.commit()
+
+    def _read_halo(self, number: int, halo: int) -> Tuple[np.array, Tuple[slice, ...]]:
+        """returns samples of the chunk extended by halo and slices of the chunk inside them"""
+        geometry = self.geometry
+        lo = np.maximum(geometry.inner_mins[number] - halo, 0)
+        hi = np.minimum(geometry.inner_maxs[number] + halo, geometry.shape)
+        inner = tuple(
+            slice(i - a, j - a) for i, j, a in zip(geometry.inner_mins[number], geometry.inner_maxs[number], lo)
+        )
+        # layout margins wide enough for the halo are already stored in the page
+        if (geometry.mins[number] <= lo).all() and (geometry.maxs[number] >= hi).all():
+            with self._page(number) as buf:
+                src = tuple(slice(a - m, b - m) for a, b, m in zip(lo, hi, geometry.mins[number]))
+                return buf.__getitem__(src).copy(), inner
+        return self.__getitem__(tuple(slice(int(a), int(b)) for a, b in zip(lo, hi))), inner
+
+    def _map_chunk(self, fn: Callable, number: int, halo: int, out_channel: Channel):
+        data, inner = self._read_halo(number, halo)
+        result = np.asarray(fn(data))
+        if result.shape == data.shape and halo:
+            result = result.__getitem__(inner)
+        chunk = out_channel.get_chunk(number)
+        mins, _ = out_channel.geometry.bounds(number)
+        inner_mins, inner_maxs = out_channel.geometry.bounds(number, margin=False)
+        chunk[tuple(slice(i - m, j - m) for i, j, m in zip(inner_mins, inner_maxs, mins))] = result
+        chunk.release()
+
+    def map_chunks(self, fn: Callable, out_channel: Channel = None, workers: int = None, halo: int = 0):
+        """writes fn of every chunk, extended by halo samples, into the same chunk of out_channel
+
+        fn returns an array shaped like its input or like the chunk without halo, chunks are processed
+        in a thread pool, numpy releases the GIL so attribute computations run in parallel. Later reads
+        of out_channel on this handle are served from its pages, unless the channel has a no value.
+        """
+        out_channel = self if out_channel is None else out_channel
+        if out_channel is self and halo:
+            raise VDSException("Chunks cannot be mapped in place with a halo, neighbouring chunks would be overwritten")
+        if out_channel.geometry.count != self.geometry.count:
+            raise VDSException(f"Channel {out_channel.name} does not share the brick layout of {self.name}")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._map_chunk, fn, number, halo, out_channel)
+                for number in range(self.geometry.count)
+            ]
+            for f in futures:
+                f.result()
+        out_channel.commit()
+        # OpenVDS keeps serving subset requests of the source decoded before the pages were written
+        out_channel._pages_written = True
+
+    def reduce_chunks(self, fn: Callable, combine: Callable, workers: int = None, halo: int = 0) -> Any:
+        """combines fn of every chunk, extended by halo samples, in chunk order"""
+        def apply(number: int) -> Any:
+            return fn(self._read_halo(number, halo)[0])
+
+        count = self.geometry.count
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return reduce(combine, executor.map(apply, range(count)))
 
 
 class VDS:
@@ -236,7 +898,7 @@ class VDS:
         connection_string: str = "",
         databrick_size: BrickSizes = BrickSizes._128,
         metadata_dict: MetadataContainer = {},
-        channels_data: List[np.array] = None,
+        channels_data: List[Union[np.array, MemmapSource]] = None,
         channels: List[Channel] = None,
         axes: List[Axis] = None,
         lod: LOD = LOD._None,
@@ -246,9 +908,30 @@ class VDS:
         full_resolution_dimension: int = 0,
         brick_size_2d_multiplier: int = 4,
         init_value: InitValue = InitValue.omit_init,
-        access_mode: AccessModes = AccessModes.ReadOnly
+        access_mode: AccessModes = AccessModes.ReadOnly,
+        max_pages: int = 8,
+        use_vdsinfo_bin: bool = False,
+        workers: int = None,
+        page_cache_size: int = 0,
+        read_engine: str = "subset",
+        chunk_metadata_page_size: int = 1024,
+        channel_options: Dict[Union[int, str], Dict[str, Any]] = None,
+        vds_info: Dict[str, Any] = None,
+        info_cache: Union[str, InfoCache] = None,
     ) -> None:
         super().__init__()
+        self.vds_info = vds_info
+        if info_cache is not None and not isinstance(info_cache, InfoCache):
+            info_cache = InfoCache(info_cache)
+        self.info_cache = info_cache
+        self.page_cache_size = page_cache_size
+        self.max_pages = max_pages
+        self.chunk_metadata_page_size = chunk_metadata_page_size
+        self.channel_options = channel_options or {}
+        self.read_engine = read_engine
+        self.workers = workers
+        self.page_cache = PageCache(page_cache_size) if page_cache_size else None
+        self.use_vdsinfo_bin = use_vdsinfo_bin
 
         if access_mode in {AccessModes.ReadOnly, AccessModes.ReadWrite, AccessModes.ReadWriteWithoutLODGeneration}:
             try:
@@ -278,7 +961,9 @@ class VDS:
                 options=options,
                 full_resolution_dimension=full_resolution_dimension,
                 brick_size_2d_multiplier=brick_size_2d_multiplier,
-                init_value=init_value
+                init_value=init_value,
+                max_pages=max_pages,
+                workers=workers,
             )
 
             self.initialize(
@@ -296,16 +981,34 @@ class VDS:
         self.closed = False
         self.path = path
         self.connection_string = connection_string
+        self.access_mode = access_mode
         self._channels = {}
         self._axes = {}
+        self._lod_views = {}
+        self._metadata = None
+        self._metadata_index = {}
         self.closed = False
 
+        self._access_manager = openvds.VolumeDataAccessManager(self._vds_source)
         self._layout = openvds.getLayout(self._vds_source)
         self._dimensionality = self._layout.getDimensionality()
 
-        vds_info = get_vds_info(path, connection_string)
+        # layouts of sources opened for writing may still change, only read only opens use the cache
+        info_cache = self.info_cache if access_mode == AccessModes.ReadOnly else None
+        vds_info = self.vds_info
+        cached = None
+        if vds_info is None and info_cache is not None:
+            cached = info_cache.get(path, connection_string)
+        if cached is not None:
+            vds_info, geometry = cached
+        derived = vds_info is None
+        if derived:
+            if self.use_vdsinfo_bin:
+                vds_info = get_vds_info(path, connection_string)
+            else:
+                vds_info = get_vds_info_from_layout(self._layout)
         _info = vds_info['layoutInfo'] if 'layoutInfo' in vds_info else vds_info
-        databrick_size = BrickSizes.get_from_info(_info)
+        self.vds_info = _info
 
         for i, j in enumerate(_info['axisDescriptors']):
             self._axes[j['name']] = Axis(
@@ -315,7 +1018,7 @@ class VDS:
                 coordinate_max=j['coordinateMax'],
                 coordinate_min=j['coordinateMin']
             )
-        self.chunks_count = self.count_number_of_chunks(self.shape, databrick_size)
+        self.chunks_count = self._access_manager.getVDSChunkCount(Dimensions._012.value, 0, 0)
         for i, j in enumerate(_info['channelDescriptors']):
 
             if access_mode == AccessModes.Create:
@@ -325,6 +1028,14 @@ class VDS:
             else:
                 _access_mode = access_mode
 
+            # page accessor settings per channel index or name, accessors are created on first use
+            options = dict(
+                access_mode=_access_mode,
+                max_pages=self.max_pages,
+                chunk_metadata_page_size=self.chunk_metadata_page_size,
+            )
+            options.update(self.channel_options.get(i, {}))
+            options.update(self.channel_options.get(j['name'], {}))
             self._channels[j['name']] = Channel(
                 vds_source=self._vds_source,
                 shape=self.shape,
@@ -336,10 +1047,28 @@ class VDS:
                 ),
                 value_range_max=j['valueRange'][1],
                 value_range_min=j['valueRange'][0],
-                accessor=self._create_accessor(channel=i, access_mode=_access_mode),
-                chunks_count=self.chunks_count
+                chunks_count=self.chunks_count,
+                access_manager=self._access_manager,
+                index=i,
+                page_cache=self.page_cache,
+                no_value=j['noValue'] if j.get('useNoValue') else None,
+                read_engine=self.read_engine,
+                workers=self.workers,
+                lod_levels=int(self._layout.getLayoutDescriptor().getLODLevels()),
+                brick_size=1 << int(self._layout.getLayoutDescriptor().brickSize),
+                **options,
             )
 
+        # channels share the brick layout, the geometry is derived once and stored with the info
+        if cached is not None:
+            for channel in self._channels.values():
+                channel._geometry = geometry
+        elif info_cache is not None and derived and self._channels:
+            geometry = self.channel(0).geometry
+            for channel in self._channels.values():
+                channel._geometry = geometry
+            info_cache.put(path, _info, connection_string, geometry)
+
     def channel(self, number: int) -> Channel:
         return self.channels[number]
 
@@ -354,14 +1083,126 @@ class VDS:
     def get_channel(self, name: str) -> Channel:
         return self._channels[name]
 
+    @property
+    def lod_levels(self) -> int:
+        return int(self._layout.getLayoutDescriptor().getLODLevels())
+
+    def lod_for_resolution(self, resolution: Sequence[int]) -> int:
+        """returns the coarsest LOD level with at least resolution samples along every axis, None skips an axis"""
+        for level in range(self.lod_levels, 0, -1):
+            factor = 1 << level
+            if all(r is None or -(-n // factor) >= r for n, r in zip(self.shape, resolution)):
+                return level
+        return 0
+
+    def lod_view(self, level: int = None, channel: int = 0, resolution: Sequence[int] = None) -> Channel:
+        """returns channel reading a LOD level, given directly or chosen from a requested output resolution"""
+        if level is None:
+            if resolution is None:
+                raise VDSException("Either LOD level or resolution has to be given")
+            level = self.lod_for_resolution(resolution)
+        if not 0 <= level <= self.lod_levels:
+            raise VDSException(f"LOD level {level} is out of range of: 0 to {self.lod_levels}")
+        if level == 0:
+            return self.channel(channel)
+        if (channel, level) not in self._lod_views:
+            base = self.channel(channel)
+            self._lod_views[(channel, level)] = Channel(
+                vds_source=self._vds_source,
+                shape=tuple(-(-n // (1 << level)) for n in self.shape),
+                components=base.components,
+                name=base.name,
+                unit=base.unit,
+                format=base.format,
+                value_range_max=base.value_range_max,
+                value_range_min=base.value_range_min,
+                chunks_count=self.access_manager.getVDSChunkCount(Dimensions._012.value, level, channel),
+                access_manager=self._access_manager,
+                index=channel,
+                page_cache=self.page_cache,
+                no_value=base.no_value,
+                read_engine=self.read_engine,
+                workers=self.workers,
+                lod_levels=self.lod_levels,
+                lod=level,
+                lod0_shape=self.shape,
+                max_pages=base.max_pages,
+                chunk_metadata_page_size=base.chunk_metadata_page_size,
+                brick_size=base.brick_size,
+            )
+        return self._lod_views[(channel, level)]
+
+    @property
+    def access_manager(self) -> openvds.VolumeDataAccessManager:
+        if getattr(self, "_access_manager", None) is None:
+            raise VDSException("Access manager is not available, VDS source is closed.")
+        return self._access_manager
+
     def close(self, flush: bool = True):
         if not getattr(self, "closed", True):
+            if self.page_cache is not None:
+                self.page_cache.clear()
+            for channel in list(self._channels.values()) + list(self._lod_views.values()):
+                channel._access_manager = None
+                channel._vds_source = None
+                channel.accessor = None
+                if channel._executor is not None:
+                    channel._executor.shutdown()
+                    channel._executor = None
+            self._access_manager = None
+            for value in self._metadata_index.values():
+                value.detach()
+            self.invalidate_metadata()
             openvds.close(self._vds_source, flush)
             self.closed = True
 
     def __del__(self):
         self.close()
 
+    def flush(self):
+        """commits written pages of every channel and flushes them, other handles of the source see them"""
+        if self.closed:
+            return
+        for channel in list(self._channels.values()) + list(self._lod_views.values()):
+            channel.commit()
+        self.access_manager.flush()
+
+    @property
+    def descriptor(self) -> Dict[str, Any]:
+        """arguments reopening this source, sources created here are reopened read only so they keep a single writer"""
+        access_mode = self.access_mode
+        if access_mode in (AccessModes.Create, AccessModes.CreateWithoutLODGeneration):
+            access_mode = AccessModes.ReadOnly
+        return dict(
+            path=self.path,
+            connection_string=self.connection_string,
+            access_mode=access_mode,
+            max_pages=self.max_pages,
+            use_vdsinfo_bin=self.use_vdsinfo_bin,
+            workers=self.workers,
+            page_cache_size=self.page_cache_size,
+            read_engine=self.read_engine,
+            chunk_metadata_page_size=self.chunk_metadata_page_size,
+            channel_options=self.channel_options,
+            vds_info=self.vds_info,
+        )
+
+    def __reduce__(self):
+        # pickles as a descriptor, unpickling returns this VDS in its own process while it is open
+        # and otherwise reuses a handle of the process opened by an earlier task
+        from ovds_utils.pool import open_shared, share_token
+        if not self.closed and self.access_mode != AccessModes.ReadOnly:
+            # handles opened from the pickle in other processes read the file, not pages held here
+            self.flush()
+        return open_shared, (self.descriptor, share_token(self))
+
+    def __copy__(self):
+        # a VDS is a handle to an open source, copies would share its access manager and pages
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __enter__(self):
         return self
 
@@ -370,7 +1211,49 @@ class VDS:
 
     @property
     def metadata(self) -> MetadataContainer:
-        return MetadataContainer.get_from_layout(self._layout)
+        """snapshot of the metadata built once, values are read from the layout on first access"""
+        if self._metadata is None:
+            # values already looked up by get_metadata are kept with what they have read
+            self._metadata_index = {
+                (i.category, i.name): self._metadata_index.get(
+                    (i.category, i.name), LayoutMetadataValue(self._layout, i.name, i.category, i.type)
+                )
+                for i in self._layout.getMetadataKeys()
+            }
+            self._metadata = MetadataContainer(**{name: v for (_, name), v in self._metadata_index.items()})
+        return self._metadata
+
+    def _find_metadata(self, name: str, category: str = None) -> Union[LayoutMetadataValue, None]:
+        """looks up one metadata key in the layout without building the snapshot"""
+        if category is not None:
+            for type in METADATATYPE_TO_OVDS_GET_FUNCTION:
+                available = getattr(self._layout, f"isMetadata{type.replace('MetadataType.', '')}Available")
+                if available(category, name):
+                    return LayoutMetadataValue(self._layout, name, category, type)
+            return None
+        # names repeated across categories resolve to the last key like in the snapshot
+        found = None
+        for i in self._layout.getMetadataKeys():
+            if i.name == name:
+                found = i
+        return None if found is None else LayoutMetadataValue(self._layout, found.name, found.category, found.type)
+
+    def get_metadata(self, name: str, category: str = None) -> Any:
+        """returns value of one metadata item, category is needed only when names repeat across categories"""
+        if self._metadata is not None:
+            value = self._metadata.get(name) if category is None else self._metadata_index.get((category, name))
+        else:
+            value = self._find_metadata(name, category)
+            if value is not None:
+                value = self._metadata_index.setdefault((value.category, value.name), value)
+        if value is None:
+            raise VDSMetadataException(f"Metadata {name} was not found in category {category}.")
+        return value.value
+
+    def invalidate_metadata(self):
+        """drops the metadata snapshot, the next access reads the keys from the layout again"""
+        self._metadata = None
+        self._metadata_index = {}
 
     @property
     def negative_margin(self) -> int:
@@ -434,7 +1317,9 @@ class VDS:
         options: Options,
         init_value: InitValue,
         metadata_dict: MetadataContainer = None,
-        channels_data: List[np.array] = None,
+        channels_data: List[Union[np.array, MemmapSource]] = None,
+        max_pages: int = 8,
+        workers: int = None,
     ):
         return create_vds(
             path=path,
@@ -452,6 +1337,8 @@ class VDS:
             brick_size_2d_multiplier=brick_size_2d_multiplier,
             full_resolution_dimension=full_resolution_dimension,
             init_value=init_value,
+            default_max_pages=max_pages,
+            workers=workers,
         )
 
     @property
@@ -469,8 +1356,7 @@ class VDS:
             chunkMetadataPageSize: int = 1024,
             dimensionsND=Dimensions._012,
     ):
-        access_manager = openvds.getAccessManager(self._vds_source)
-        accessor = access_manager.createVolumeDataPageAccessor(
+        accessor = self.access_manager.createVolumeDataPageAccessor(
             dimensionsND=dimensionsND.value,
             accessMode=access_mode.value,
             lod=lod,
@@ -483,114 +1369,165 @@ class VDS:
 
     @staticmethod
     def count_number_of_chunks(shape: int, brick_size: BrickSizes):
-        x = [round(i/(2**brick_size.value.value)) for i in shape]
         r = 1
-        for i in x:
-            if i != 0:
-                r *= i
+        for i in shape:
+            r *= -(-i // 2**brick_size.value.value)
         return r
 
     def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
         return self.channel(0).__getitem__(key)
 
+    def read_into(self, key: Sequence[Union[int, slice]], out: np.array, channel: int = 0) -> np.array:
+        return self.channel(channel).read_into(key, out)
+
+    def to_dask(self, channel: int = 0, lod: int = 0):
+        from ovds_utils.dask_array import to_dask
+        return to_dask(self, channel, lod)
+
+    def read_channels(
+        self,
+        key: Sequence[Union[int, slice]],
+        channels: Sequence[Union[int, str]] = None,
+        layout: str = "stack",
+    ) -> Union[np.array, Dict[str, np.array]]:
+        """reads the same key from several channels into one preallocated output"""
+        if layout not in CHANNEL_LAYOUTS:
+            raise VDSException(f"Layout {layout} was not recognized among: {', '.join(CHANNEL_LAYOUTS)}")
+        if channels is None:
+            selected = self.channels
+        else:
+            selected = [self.channel(c) if isinstance(c, int) else self.get_channel(c) for c in channels]
+        dtypes = [FORMAT2NPTYPE[c.format.value] for c in selected]
+        first = selected[0]
+        ranges, squeeze, flip = first._normalize_key(key)
+        shape = tuple(len(r) for r, sq in zip(ranges, squeeze) if not sq)
+
+        if layout == "structured":
+            out = np.empty(shape, dtype=[(c.name, d) for c, d in zip(selected, dtypes)])
+            targets = [out[c.name] for c in selected]
+        else:
+            out = np.empty((len(selected),) + shape, dtype=np.result_type(*dtypes))
+            targets = list(out)
+        if any(len(r) == 0 for r in ranges):
+            return dict(zip([c.name for c in selected], targets)) if layout == "dict" else out
+
+        begin, end, post_key = first._parse_key(key)
+        # channels share the brick layout, so the brick plan is computed once
+        if (
+            all(r.step == 1 for r in ranges) and not any(flip)
+            and all(c._use_bricks(begin, end) for c in selected)
+        ):
+            region = tuple(None if sq else slice(None) for sq in squeeze)
+            if first._single_brick(begin, end):
+                for c, target in zip(selected, targets):
+                    c._read_bricks(begin, end, out=target.__getitem__(region))
+                return dict(zip([c.name for c in selected], targets)) if layout == "dict" else out
+            # builds accessors and geometries before pages are read from worker threads
+            for c in selected:
+                if c.geometry.count != first.geometry.count:
+                    raise VDSException(f"Channel {c.name} does not share the brick layout of {first.name}")
+            plan = first.geometry.intersecting(begin, end)
+            futures = []
+            for c, target in zip(selected, targets):
+                futures.extend(
+                    c.executor.submit(c._copy_chunk, *p, target.__getitem__(region), begin) for p in plan
+                )
+            for f in futures:
+                f.result()
+        else:
+            requests = [c.read_async(key, out=target) for c, target in zip(selected, targets)]
+            for request in requests:
+                request.result()
+        if layout == "dict":
+            return dict(zip([c.name for c in selected], targets))
+        return out
+
+    def read_traces(
+        self,
+        coords: np.array,
+        sample_range: Union[slice, Tuple[int, int]] = None,
+        channel: int = 0
+    ) -> np.array:
+        return self.channel(channel).read_traces(coords, sample_range)
+
+    def read_many(self, keys: Sequence[Sequence[Union[int, slice]]], channel: int = 0) -> List[VDSRequest]:
+        return [self.channel(channel).read_async(key) for key in keys]
+
 
 class VDSComposite:
-    def __init__(self, subsets: Sequence[VDS] = None, slice_dim: int = None) -> None:
+    """Concatenation of VDS subsets along ``slice_dim``.
+
+    Subsets are located with a bisect over cumulative offsets, only subsets overlapping
+    the key are read, and every part is read concurrently into its region of one output.
+    """
+
+    def __init__(self, subsets: Sequence[VDS] = None, slice_dim: int = None, workers: int = None) -> None:
         if subsets is None:
             subsets = []
         if slice_dim is None:
             slice_dim = 0
-        self.__subsets = subsets
-        self.__shapes = []
-
-        for s in self.__subsets:
-            self.__shapes.append(s.shape)
-
+        self.__subsets = list(subsets)
         self.__slice_dim = slice_dim
+        self.workers = workers
+        self._executor = None
+        self._update_index()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(subsets={len(self.__subsets)}, shape={self.shape})>"
 
+    def _update_index(self):
+        self.__offsets = [0]
         self.shape = None
-        for i, s in enumerate(subsets):
-            if i == 0:
-                self.shape = list(s.shape)
-            else:
-                self.shape[slice_dim] += s.shape[slice_dim]
+        for s in self.__subsets:
+            shape = tuple(s.shape)
+            if self.shape is not None and any(
+                a != b for i, (a, b) in enumerate(zip(shape, self.shape)) if i != self.__slice_dim
+            ):
+                raise VDSException(f"Subset of shape {shape} does not match composite shape {tuple(self.shape)}")
+            self.__offsets.append(self.__offsets[-1] + shape[self.__slice_dim])
+            self.shape = shape
+        if self.shape is not None:
+            self.shape = tuple(self.__offsets[-1] if i == self.__slice_dim else n for i, n in enumerate(self.shape))
 
     def add_subset(self, subset: VDS):
         self.__subsets.append(subset)
-        self.__shapes.append(subset.shape)
-
-        self.shape = None
-        for i, s in enumerate(self.__subsets):
-            if i == 0:
-                self.shape = list(s.shape)
-            else:
-                self.shape[self.__slice_dim] += s.shape[self.__slice_dim]
+        self._update_index()
 
-        self.shape = tuple(self.shape)
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _parts(self, r: range) -> Iterator[Tuple[int, slice, slice]]:
+        """yields (subset, subset slice, output slice) of subsets holding sampled indices of r"""
+        first = bisect_right(self.__offsets, r.start) - 1
+        for i in range(first, bisect_right(self.__offsets, r[-1])):
+            overlap = sampled_overlap(r, self.__offsets[i], self.__offsets[i + 1])
+            if overlap is not None:
+                yield (i,) + overlap
 
     def __getitem__(self, key: Sequence[Union[int, slice]]) -> np.array:
-        is_int = False
-        if all([isinstance(i, slice) or isinstance(i, int) for i in key]):
-            if all([isinstance(i, int) for i in key]):
-                cnt = 0
-                _slice = key[self.__slice_dim]
-                key = list(key)
-                for i in range(len(self.__shapes)):
-                    b = cnt + self.__shapes[i][self.__slice_dim]
-                    if _slice >= cnt and _slice < b:
-                        key[self.__slice_dim] = _slice - cnt
-                        return self.__subsets[i].__getitem__(tuple(key))
-                    cnt += self.__shapes[i][self.__slice_dim]
-            else:
-                _key = []
-                for i, k in enumerate(key):
-                    if isinstance(k, int):
-                        is_int = True
-                        _key.append(slice(k, k+1))
-                    else:
-                        _key.append(slice(k.start or 0, k.stop or 0, k.step))
-                _key = tuple(_key)
-        else:
-            raise VDSException("Key elements must be instances of slice or int.")
-
-        for i, k in enumerate(_key):
-            if k.start is not None and (k.start > self.shape[i] + 1 or k.stop > self.shape[i] + 1):
-                raise Exception(f"{_key} is out of range {self.shape}")
-
-        _slice = _key[self.__slice_dim]
-        keys = []
-        a = 0
-        for i in range(len(self.__shapes)):
-            b = a + self.__shapes[i][0]
-            if _slice.start < b and (_slice.start == _slice.stop):
-                _slices = list(deepcopy(_key))
-                _slices[self.__slice_dim] = slice(0, _slice.stop - a)
-                keys.append(tuple(_slices))
-                break
-            elif _slice.start < b:
-                _slices = list(deepcopy(_key))
-                _slices[self.__slice_dim] = slice(
-                    0,
-                    self.__shapes[i][self.__slice_dim]
-                )
-                keys.append(tuple(_slices))
+        if self.shape is None:
+            raise VDSException("Composite has no subsets.")
+        ranges, squeeze, flip = normalize_key(key, self.shape)
+        dtype = np.result_type(*[FORMAT2NPTYPE[s.channel(0).format.value] for s in self.__subsets])
+        out = np.empty([len(r) for r in ranges], dtype=dtype)
+        dim = self.__slice_dim
+
+        if all(len(r) for r in ranges):
+            base = [slice(r[0], r[-1] + 1, r.step) for r in ranges]
+            parts = []
+            for i, src, dst in self._parts(ranges[dim]):
+                subkey = tuple(src if d == dim else k for d, k in enumerate(base))
+                target = out.__getitem__((slice(None),) * dim + (dst,))
+                parts.append((self.__subsets[i].channel(0), subkey, target))
+            if len(parts) == 1:
+                parts[0][0].read_into(parts[0][1], parts[0][2])
             else:
-                keys.append(None)
-            if _slice.stop < b:
-                _slices = list(deepcopy(keys[-1]))
-                _slices[self.__slice_dim] = slice(0, _slice.stop - a)
-                keys[-1] = tuple(_slices)
-                break
-            a += self.__shapes[i][0]
-        result_list = []
-        for i, s in enumerate(keys):
-            if s:
-                result_list.append(self.__subsets[i].__getitem__(s))
-        if is_int:
-            return np.concatenate(tuple(result_list), axis=self.__slice_dim).__getitem__(
-                tuple(
-                    slice(None, None) if isinstance(i, slice) else 0 for i in key
-                )
-            )
+                futures = [self.executor.submit(c.read_into, k, t) for c, k, t in parts]
+                for f in futures:
+                    f.result()
 
-        return np.concatenate(tuple(result_list), axis=self.__slice_dim)
+        post_key = Channel._post_key(squeeze, flip, [1] * len(ranges))
+        return out if post_key is None else out.__getitem__(post_key)
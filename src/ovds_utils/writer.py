@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+import openvds
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.geometry import ChunkGeometry
+from ovds_utils.logging import get_logger
+from ovds_utils.metadata import MetadataContainer
+from ovds_utils.ovds import LOD, AccessModes, BrickSizes, InitValue, Options, create_vds
+from ovds_utils.ovds.writing import FORMAT2NPTYPE
+from ovds_utils.vds import Axis, Channel
+
+logger = get_logger(__name__)
+
+
+class VDSWriter:
+    """Creates a new VDS and fills it from slabs along the first axis.
+
+    Slabs are buffered per brick row and the pages of a row are written as soon as
+    the row is complete, so memory is bounded by one brick row per channel when slabs
+    arrive in order.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        axes: List[Axis],
+        channels: List[Channel],
+        connection_string: str = "",
+        databrick_size: BrickSizes = BrickSizes._128,
+        metadata_dict: MetadataContainer = None,
+        lod: LOD = LOD._None,
+        options: Options = Options._None,
+        full_resolution_dimension: int = 0,
+        brick_size_2d_multiplier: int = 4,
+        max_pages: int = 8,
+    ) -> None:
+        self.path = path
+        self.connection_string = connection_string
+        self.shape = tuple(a.samples for a in axes)
+        self.channels = channels
+        self.closed = False
+        self._vds_source = create_vds(
+            path=path,
+            connection_string=connection_string,
+            metadata_dict=metadata_dict or {},
+            channels=channels,
+            axes=axes,
+            negative_margin=0,
+            positive_margin=0,
+            databrick_size=databrick_size.value,
+            access_mode=AccessModes.Create.value,
+            lod=lod.value,
+            options=options.value,
+            brick_size_2d_multiplier=brick_size_2d_multiplier,
+            full_resolution_dimension=full_resolution_dimension,
+            init_value=InitValue.omit_init,
+        )
+        access_manager = openvds.VolumeDataAccessManager(self._vds_source)
+        self._accessors = [
+            access_manager.createVolumeDataPageAccessor(
+                dimensionsND=c.dimensions_nd.value,
+                accessMode=AccessModes.Create.value,
+                lod=0,
+                channel=i,
+                maxPages=max_pages,
+            )
+            for i, c in enumerate(channels)
+        ]
+        self._rows, self._row_chunks = self._get_brick_rows(self._accessors[0])
+        self._row_starts = [r[0] for r in self._rows]
+        self._buffers = [{} for _ in channels]
+        self._written = [set() for _ in channels]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__}(path={self.path}, shape={self.shape})>"
+
+    @staticmethod
+    def _get_brick_rows(
+        accessor: openvds.core.VolumeDataPageAccessor
+    ) -> Tuple[List[Tuple[int, int]], List[List[int]]]:
+        geometry = ChunkGeometry.from_accessor(accessor)
+        rows = {}
+        for c in range(geometry.count):
+            rows.setdefault((int(geometry.mins[c, 0]), int(geometry.maxs[c, 0])), []).append(c)
+        keys = sorted(rows)
+        return keys, [rows[k] for k in keys]
+
+    def _as_range(self, axis0_range: Union[Tuple[int, int], range, slice]) -> Tuple[int, int]:
+        if isinstance(axis0_range, slice):
+            start, stop, step = axis0_range.indices(self.shape[0])
+            if step != 1:
+                raise VDSException(f"Slab range {axis0_range} must not have a step")
+            return start, stop
+        if isinstance(axis0_range, range):
+            return axis0_range.start, axis0_range.stop
+        start, stop = axis0_range
+        return start, stop
+
+    def write_slab(self, axis0_range: Union[Tuple[int, int], range, slice], array: np.array, channel: int = 0):
+        if self.closed:
+            raise VDSException("Writer is closed.")
+        start, stop = self._as_range(axis0_range)
+        if start < 0 or stop > self.shape[0] or start >= stop:
+            raise VDSException(f"Slab range ({start}, {stop}) is out of range of: 0 to {self.shape[0]}")
+        expected = (stop - start,) + self.shape[1:]
+        if tuple(array.shape) != expected:
+            raise VDSException(f"Slab shape {array.shape} does not match expected shape {expected}")
+
+        dtype = FORMAT2NPTYPE[self.channels[channel].format.value]
+        buffers = self._buffers[channel]
+        row = bisect_right(self._row_starts, start) - 1
+        while row < len(self._rows) and self._rows[row][0] < stop:
+            r0, r1 = self._rows[row]
+            if row in self._written[channel]:
+                raise VDSException(f"Brick row ({r0}, {r1}) of channel {channel} was already written.")
+            if row not in buffers:
+                buffers[row] = (
+                    np.empty((r1 - r0,) + self.shape[1:], dtype=dtype),
+                    np.zeros(r1 - r0, dtype=bool)
+                )
+            buf, filled = buffers[row]
+            lo, hi = max(start, r0), min(stop, r1)
+            buf[lo - r0:hi - r0] = array[lo - start:hi - start]
+            filled[lo - r0:hi - r0] = True
+            if filled.all():
+                self._flush_row(channel, row)
+            row += 1
+
+    def write_slabs(self, slabs: Iterable[Tuple[Union[Tuple[int, int], range, slice], np.array]], channel: int = 0):
+        for axis0_range, array in slabs:
+            self.write_slab(axis0_range, array, channel=channel)
+
+    def _flush_row(self, channel: int, row: int):
+        accessor = self._accessors[channel]
+        dtype = FORMAT2NPTYPE[self.channels[channel].format.value]
+        buf, _ = self._buffers[channel].pop(row)
+        r0 = self._rows[row][0]
+        for c in self._row_chunks[row]:
+            page = accessor.createPage(c)
+            page_buf = np.array(page.getWritableBuffer(), copy=False, dtype=dtype)
+            (min, max) = page.getMinMax()
+            page_buf[:, :, :] = buf[
+                min[2] - r0: max[2] - r0,
+                min[1]: max[1],
+                min[0]: max[0],
+            ]
+            page.release()
+        self._written[channel].add(row)
+
+    @property
+    def missing_rows(self) -> List[Sequence[Tuple[int, int]]]:
+        return [
+            [self._rows[r] for r in range(len(self._rows)) if r not in written]
+            for written in self._written
+        ]
+
+    def close(self, flush: bool = True):
+        if self.closed:
+            return
+        for i, missing in enumerate(self.missing_rows):
+            if missing:
+                logger.warning(f"Channel {i} has {len(missing)} brick rows that were not written: {missing}")
+        for accessor in self._accessors:
+            accessor.commit()
+        self._accessors = []
+        self._buffers = [{} for _ in self.channels]
+        openvds.close(self._vds_source, flush)
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, "_vds_source"):
+            self.close()
@@ -0,0 +1,34 @@
+import pytest
+
+from ovds_utils.ovds.enums import BrickSizes, Formats
+from ovds_utils.vds import VDS, AccessModes, Axis, Channel, Components
+
+
+def _create_vds(path, data):
+    names = ["Sample", "Crossline", "Inline"]
+    return VDS(
+        path,
+        axes=[
+            Axis(samples=s, name=names[i], unit="unitless", coordinate_min=-1000.0, coordinate_max=1000.0)
+            for i, s in enumerate(data.shape)
+        ],
+        channels=[
+            Channel(
+                name="Amplitude",
+                format=Formats.R32,
+                unit="unitless",
+                value_range_min=0.0,
+                value_range_max=1.0,
+                components=Components._1
+            )
+        ],
+        channels_data=[data],
+        databrick_size=BrickSizes._64,
+        access_mode=AccessModes.Create
+    )
+
+
+@pytest.fixture
+def create_vds():
+    """returns factory creating a single channel VDS at path filled with data"""
+    return _create_vds
@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from ovds_utils.cache import InfoCache, PageCache
+from ovds_utils.exceptions import VDSException
+from ovds_utils.vds import VDS, AccessModes
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+def loader(pages, size=1024):
+    def load():
+        page = FakePage()
+        pages.append(page)
+        return page, np.zeros(size, dtype=np.uint8)
+    return load
+
+
+def test_page_cache_evicts_least_recently_used():
+    pages = []
+    cache = PageCache(max_bytes=2048)
+    cache.get((0, 0, 0), loader(pages))
+    cache.get((0, 0, 1), loader(pages))
+    cache.get((0, 0, 0), loader(pages))
+    cache.get((0, 0, 2), loader(pages))
+
+    assert (0, 0, 1) not in cache
+    assert (0, 0, 0) in cache and (0, 0, 2) in cache
+    assert [p.released for p in pages] == [False, True, False]
+    assert cache.stats == dict(hits=1, misses=3, evictions=1, entries=2, nbytes=2048)
+
+
+def test_page_cache_keeps_pinned_pages():
+    pages = []
+    cache = PageCache(max_bytes=1024)
+    with cache.pinned((0, 0, 0), loader(pages)):
+        cache.get((0, 0, 1), loader(pages))
+        assert (0, 0, 0) in cache
+        assert (0, 0, 1) in cache
+    cache.get((0, 0, 2), loader(pages))
+    assert len(cache) == 1 and (0, 0, 2) in cache
+
+    with pytest.raises(VDSException):
+        cache.pin((0, 0, 0))
+
+    cache.clear()
+    assert all(p.released for p in pages)
+    assert cache.nbytes == 0
+
+
+def test_info_cache_serves_entries_while_fingerprint_matches(tmp_path):
+    source = tmp_path / "example.vds"
+    source.write_bytes(b"0" * 16)
+    cache = InfoCache(tmp_path / "info")
+    info = {"axisDescriptors": [{"name": "Sample", "numSamples": 16}]}
+
+    assert cache.get(str(source)) is None
+    cache.put(str(source), info)
+    assert cache.get(str(source)) == (info, None)
+    assert cache.get(str(source), "connection") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    source.write_bytes(b"0" * 32)
+    assert cache.get(str(source)) is None
+
+    cache.put("s3://bucket/example.vds", info)
+    assert cache.get("s3://bucket/example.vds") is None
+    cache.clear()
+    assert not list((tmp_path / "info").iterdir())
+
+    trusted = InfoCache(tmp_path / "info", trust_remote=True)
+    trusted.put("s3://bucket/example.vds", info, "Region=eu-north-1")
+    assert trusted.get("s3://bucket/example.vds", "Region=eu-north-1") == (info, None)
+    assert trusted.get("s3://bucket/example.vds") is None
+    assert cache.get("s3://bucket/example.vds", "Region=eu-north-1") is None
+
+
+def test_info_cache_writes_entries_concurrently(tmp_path):
+    source = tmp_path / "example.vds"
+    source.write_bytes(b"0" * 16)
+    cache = InfoCache(tmp_path / "info")
+    info = {"axisDescriptors": [{"name": "Sample", "numSamples": 16}]}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: cache.put(str(source), info), range(64)))
+    assert cache.get(str(source)) == (info, None)
+    assert [f.suffix for f in (tmp_path / "info").iterdir()] == [".json"]
+
+
+def test_vds_info_is_served_from_info_cache(tmp_path, create_vds):
+    data = np.random.rand(20, 30, 40).astype(np.float32)
+    path = str(tmp_path / "example.vds")
+    create_vds(path, data).close()
+    cache = InfoCache(tmp_path / "info")
+
+    with VDS(path, info_cache=cache) as vds:
+        info = vds.vds_info
+        geometry = vds.channel(0).geometry
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    with VDS(path, info_cache=cache) as vds:
+        assert vds.vds_info == info
+        assert vds.shape == data.shape
+        # the geometry is loaded from the sidecar without creating a page accessor
+        cached = vds.channel(0)._geometry
+        assert cached is not None and vds.channel(0)._accessor is None
+        for name in ("mins", "maxs", "inner_mins", "inner_maxs", "grid"):
+            assert np.array_equal(getattr(cached, name), getattr(geometry, name))
+        assert cached.shape == geometry.shape and cached.brick_size == geometry.brick_size
+        assert np.array_equal(vds[:, :, :], data)
+        assert np.array_equal(vds.channel(0).get_chunk(0)[:, :, :], data[vds.channel(0).get_chunk(0).slices])
+    assert cache.hits == 1
+
+    with VDS(path, access_mode=AccessModes.ReadWrite, info_cache=cache):
+        pass
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,50 @@
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.vds import VDSComposite
+
+
+@pytest.mark.parametrize("slice_dim", [0, 1, 2])
+def test_composite_reads_match_concatenated_data(slice_dim, create_vds):
+    parts = []
+    for n in (30, 7, 50):
+        shape = [40, 20, 60]
+        shape[slice_dim] = n
+        parts.append(np.random.rand(*shape).astype(np.float32))
+    data = np.concatenate(parts, axis=slice_dim)
+
+    with TemporaryDirectory() as dir:
+        subsets = [create_vds(os.path.join(dir, f"part{i}.vds"), p) for i, p in enumerate(parts)]
+        composite = VDSComposite(subsets[:2], slice_dim=slice_dim)
+        composite.add_subset(subsets[2])
+        assert composite.shape == data.shape
+
+        keys = [
+            (slice(None), slice(None), slice(None)),
+            (slice(5, 35), slice(2, 18), slice(10, 50)),
+            (slice(None, None, 4), slice(None, None, 3), slice(None, None, 5)),
+            (slice(None, None, -1), 3, slice(-20, None)),
+            (31, 6, 32),
+            (Ellipsis, 40),
+        ]
+        for key in keys:
+            assert np.array_equal(composite[key], data[key]), key
+
+        with pytest.raises(VDSException):
+            composite[data.shape[0], 0, 0]
+        for s in subsets:
+            s.close()
+
+
+def test_composite_rejects_mismatched_subsets(create_vds):
+    with TemporaryDirectory() as dir:
+        a = create_vds(os.path.join(dir, "a.vds"), np.zeros((10, 20, 30), dtype=np.float32))
+        b = create_vds(os.path.join(dir, "b.vds"), np.zeros((10, 21, 30), dtype=np.float32))
+        with pytest.raises(VDSException):
+            VDSComposite([a, b])
+        a.close()
+        b.close()
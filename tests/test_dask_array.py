@@ -0,0 +1,41 @@
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from ovds_utils.dask_array import brick_chunks, read_brick
+from ovds_utils.vds import VDS
+
+
+def test_brick_chunks_and_reads_match_bricks(create_vds):
+    data = np.random.rand(100, 70, 130).astype(np.float32)
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_vds(path, data).close()
+        with VDS(path) as vds:
+            channel = vds.channel(0)
+            assert brick_chunks(channel) == ((64, 36), (64, 6), (64, 64, 2))
+            for number in range(channel.geometry.count):
+                assert np.array_equal(read_brick(vds, 0, 0, number), data[channel.geometry.slices(number)])
+
+
+def test_to_dask_blocks_are_bricks(create_vds):
+    pytest.importorskip("dask.array")
+    data = np.random.rand(100, 70, 130).astype(np.float32)
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_vds(path, data).close()
+        with VDS(path) as vds:
+            array = vds.to_dask()
+            assert array.chunks == ((64, 36), (64, 6), (64, 64, 2))
+            assert np.array_equal(array.compute(scheduler="threads"), data)
+            assert np.isclose(array[10:90, :, 3].mean().compute(), data[10:90, :, 3].mean())
+
+
+def test_to_dask_processes_read_pages_of_open_created_vds(create_vds):
+    pytest.importorskip("dask.array")
+    data = np.random.rand(100, 70, 130).astype(np.float32)
+    with TemporaryDirectory() as dir:
+        with create_vds(os.path.join(dir, "example.vds"), data) as vds:
+            assert np.array_equal(vds.to_dask().compute(scheduler="processes", num_workers=2), data)
@@ -0,0 +1,49 @@
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.mosaic import VDSMosaic
+
+
+def test_mosaic_reads_grid_of_tiles_with_gaps(create_vds):
+    shape = (60, 50, 40)
+    data = np.random.rand(*shape).astype(np.float32)
+    # 2 x 2 grid of inline x crossline tiles, the tile at (30, 25) is missing
+    origins = [(0, 0, 0), (30, 0, 0), (0, 25, 0)]
+    expected = np.full(shape, -1.0, dtype=np.float32)
+    with TemporaryDirectory() as dir:
+        tiles = []
+        for i, (o0, o1, o2) in enumerate(origins):
+            region = (slice(o0, o0 + 30), slice(o1, o1 + 25), slice(o2, o2 + 40))
+            expected[region] = data[region]
+            tiles.append((create_vds(os.path.join(dir, f"tile{i}.vds"), data[region].copy()), (o0, o1, o2)))
+        mosaic = VDSMosaic(tiles[:2], shape=shape, no_value=-1.0)
+        mosaic.add_tile(*tiles[2])
+        assert mosaic.shape == shape
+        assert len(mosaic) == 3
+
+        keys = [
+            (slice(None), slice(None), slice(None)),
+            (slice(20, 45), slice(10, 40), 7),
+            (slice(None, None, 7), slice(None, None, -3), slice(5, 35, 2)),
+            (45, 40, slice(None)),
+            (Ellipsis, -1),
+        ]
+        for key in keys:
+            assert np.array_equal(mosaic[key], expected[key]), key
+
+        assert mosaic.intersecting((25, 20, 0), (35, 30, 1)) == [0, 1, 2]
+        chunks = list(mosaic.chunks())
+        assert len(chunks) == 3
+        for slices, chunk in chunks:
+            assert np.array_equal(chunk[:, :, :], expected[slices])
+
+        with pytest.raises(VDSException):
+            mosaic.add_tile(tiles[0][0], (10, 10, 0))
+        with pytest.raises(VDSException):
+            mosaic.add_tile(tiles[0][0], (40, 40, 0))
+        for t, _ in tiles:
+            t.close()
@@ -0,0 +1,123 @@
+import copy
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.ovds import AccessModes
+from ovds_utils.pool import VDSPool, close_shared
+from ovds_utils.vds import VDS
+
+
+def read_trace(vds, i):
+    return os.getpid(), id(vds), vds[i, 3, :]
+
+
+def test_vds_pickles_as_descriptor_and_reopens_shared_handle(create_vds):
+    data = np.random.rand(30, 20, 40).astype(np.float32)
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        create_vds(path, data).close()
+        with VDS(path, max_pages=4) as vds:
+            payload = pickle.dumps(vds)
+            assert len(payload) < 4096
+            assert pickle.loads(payload) is vds
+
+            with ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn")) as executor:
+                results = list(executor.map(read_trace, [vds] * 6, range(6)))
+            for i, (_, _, trace) in enumerate(results):
+                assert np.array_equal(trace, data[i, 3, :])
+            handles = {}
+            for pid, handle, _ in results:
+                handles.setdefault(pid, set()).add(handle)
+            assert all(len(h) == 1 for h in handles.values())
+
+        restored = pickle.loads(payload)
+        assert restored is not vds
+        assert restored is pickle.loads(payload)
+        assert restored.max_pages == 4
+        assert np.array_equal(restored[:, :, :], data)
+        close_shared()
+        assert restored.closed
+
+        with create_vds(os.path.join(dir, "created.vds"), data) as vds:
+            assert copy.copy(vds) is vds and copy.deepcopy(vds) is vds
+            assert np.array_equal(pickle.loads(pickle.dumps(vds))[:, :, :], data)
+        restored = pickle.loads(pickle.dumps(vds))
+        assert restored is not vds and np.array_equal(restored[:, :, :], data)
+        assert restored.access_mode == AccessModes.ReadOnly
+        close_shared()
+
+
+def test_vds_pool_shares_handles_and_evicts_unreferenced(create_vds):
+    data = np.random.rand(30, 20, 40).astype(np.float32)
+    with TemporaryDirectory() as dir:
+        paths = [os.path.join(dir, f"cube{i}.vds") for i in range(3)]
+        for path in paths:
+            create_vds(path, data).close()
+
+        pool = VDSPool(max_open=2, page_cache_size=0)
+        a = pool.get(paths[0])
+        assert pool.get(paths[0]) is a
+        assert a.page_cache is None
+        pool.release(a)
+        with pool.handle(paths[1]) as b:
+            assert np.array_equal(b[3, :, :], data[3])
+        assert pool.stats == dict(hits=1, misses=2, evictions=0, open=2, referenced=1)
+
+        # cube1 is the least recently used source without references
+        with pool.handle(paths[2]):
+            pass
+        assert b.closed and not a.closed
+        assert pool.stats["evictions"] == 1
+
+        with pool.handle(paths[1]) as c:
+            assert c is not b
+            assert np.array_equal(c[:, :, :], data)
+
+        pool.release(a)
+        with pytest.raises(VDSException):
+            pool.release(a)
+        with pytest.raises(VDSException):
+            pool.get(paths[0], mode=AccessModes.Create)
+        pool.close()
+        assert a.closed and c.closed
+
+        pool = VDSPool(max_open=None)
+        assert pool.get(paths[0], page_cache_size=0) is not pool.get(paths[0])
+        pool.close()
+
+
+def test_vds_pool_opens_sources_outside_the_lock(create_vds, monkeypatch):
+    data = np.random.rand(30, 20, 40).astype(np.float32)
+    with TemporaryDirectory() as dir:
+        paths = [os.path.join(dir, f"cube{i}.vds") for i in range(2)]
+        for path in paths:
+            create_vds(path, data).close()
+
+        opening, proceed = threading.Event(), threading.Event()
+
+        def slow_vds(path, *args, **kwargs):
+            if path == paths[0]:
+                opening.set()
+                proceed.wait(5)
+            return VDS(path, *args, **kwargs)
+
+        monkeypatch.setattr("ovds_utils.pool.VDS", slow_vds)
+        pool = VDSPool(max_open=None)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            slow = [executor.submit(pool.get, paths[0]) for _ in range(2)]
+            assert opening.wait(5)
+            # another source is opened while the first one is still opening
+            assert np.array_equal(pool.get(paths[1])[:, :, :], data)
+            assert not slow[0].done()
+            proceed.set()
+            assert slow[0].result() is slow[1].result()
+        assert pool.stats == dict(hits=1, misses=2, evictions=0, open=2, referenced=2)
+        pool.close()
@@ -1,11 +1,23 @@
+import asyncio
 import os
+import threading
+import tracemalloc
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from tempfile import TemporaryDirectory
 
 import numpy as np
+import openvds
+import pytest
 
+from ovds_utils.exceptions import VDSException, VDSMetadataException, VDSRequestException
+from ovds_utils.geometry import ChunkGeometry
 from ovds_utils.metadata import MetadataTypes, MetadataValue
-from ovds_utils.ovds.enums import BrickSizes, Formats
-from ovds_utils.vds import VDS, Axis, Channel, Components, AccessModes
+from ovds_utils.ovds import MemmapSource
+from ovds_utils.ovds.enums import LOD, BrickSizes, Formats, InitValue
+from ovds_utils.ovds.utils import get_vds_info, get_vds_info_from_layout
+from ovds_utils.ovds.writing import split_chunks
+from ovds_utils.vds import VDS, Axis, Channel, Components, AccessModes, VDSRequest
 
 
 def test_vds_shape():
@@ -200,3 +212,1046 @@ def test_vds_3d_cube_initialize_and_wirte_later():
                     np.array_equal(data[i, 0, :], vds[i, 0, :])
                     for i in range(shape[0])
                 )
+
+
+def test_vds_channels_share_access_manager():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        vds = VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data,
+                data * 2
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                ),
+                Channel(
+                    name="Amplitude2",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=2.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            max_pages=16
+        )
+        assert vds.channel(0).access_manager is vds.channel(1).access_manager is vds.access_manager
+        assert vds.channel(0).accessor.getMaxPages() == 16
+        for i in range(shape[0]):
+            assert np.array_equal(data[i, 0, :5], vds[i, 0, :5])
+        channel = vds.channel(0)
+        vds.close()
+        with pytest.raises(VDSException):
+            channel[0, 0, :5]
+
+
+class PendingRequest:
+    """stands in for a VolumeDataRequest that completes only when canceled or failed"""
+
+    def __init__(self, error_code=0, error_message=""):
+        self.isCompleted = False
+        self.isCanceled = False
+        self.errorCode = error_code
+        self.errorMessage = error_message
+        self._finished = threading.Event()
+        self.timeouts = []
+
+    def fail(self):
+        self.isCanceled = True
+        self._finished.set()
+
+    def waitForCompletion(self, timeout=0.0):
+        self.timeouts.append(timeout)
+        self._finished.wait(timeout or None)
+        return self.isCompleted
+
+    def cancelAndWaitForCompletion(self):
+        self.fail()
+
+
+def test_vds_read_many_and_read_async():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create
+        ) as vds:
+            keys = [(i, slice(None), slice(0, 5)) for i in range(0, shape[0], 10)]
+            requests = vds.read_many(keys)
+            for key, request in zip(keys, requests):
+                assert np.array_equal(data[key], request.result())
+                assert request.done()
+
+            async def gather():
+                return await asyncio.gather(*[vds.channel(0).read_async(key) for key in keys])
+
+            for key, result in zip(keys, asyncio.run(gather())):
+                assert np.array_equal(data[key], result)
+
+    failing = PendingRequest(error_code=5, error_message="download failed")
+    failing.fail()
+    request = VDSRequest(failing, object(), (1, 1, 1))
+    assert isinstance(request.exception(), VDSRequestException)
+    with pytest.raises(VDSRequestException):
+        asyncio.run(asyncio.wait_for(request, 1.0))
+
+    request = VDSRequest(PendingRequest(), object(), (1, 1, 1))
+    assert request.cancel()
+    assert request.cancelled()
+    with pytest.raises(CancelledError):
+        request.result()
+
+    pending = PendingRequest()
+    request = VDSRequest(pending, object(), (1, 1, 1))
+    with pytest.raises(FuturesTimeoutError):
+        request.result(timeout=0)
+    assert not pending.timeouts
+    with pytest.raises(FuturesTimeoutError):
+        request.result(timeout=0.0001)
+    assert pending.timeouts == [0.001]
+
+    async def cancel_waiting():
+        task = asyncio.ensure_future(request)
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_waiting())
+    assert pending.isCanceled and request.cancelled()
+
+
+def test_vds_layout_info_matches_vdsinfo():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        with VDS(
+            path,
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create
+        ) as vds:
+            layout_info = get_vds_info_from_layout(vds._layout)
+            vdsinfo = get_vds_info(path, "")
+
+        for a, b in zip(layout_info["axisDescriptors"], vdsinfo["axisDescriptors"]):
+            assert a == b
+        for a, b in zip(layout_info["channelDescriptors"], vdsinfo["channelDescriptors"]):
+            assert a == {k: b[k] for k in a}
+        assert layout_info["layoutDescriptor"] == {
+            k: vdsinfo["layoutDescriptor"][k] for k in layout_info["layoutDescriptor"]
+        }
+
+        with VDS(path, use_vdsinfo_bin=True) as a, VDS(path) as b:
+            assert a.shape == b.shape == shape
+            assert a.axis_descriptors == b.axis_descriptors
+            assert np.array_equal(a[:, 0, :], b[:, 0, :])
+
+
+def test_split_chunks_is_contiguous():
+    ranges = split_chunks(10, 3)
+    assert [list(r) for r in ranges] == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert split_chunks(2, 8) == [range(0, 1), range(1, 2)]
+
+
+def test_vds_create_with_parallel_writer():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float64)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Channel0",
+                    format=Formats.R64,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            workers=4
+        ) as vds:
+            assert np.array_equal(data, vds[:, :, :])
+
+
+@pytest.mark.parametrize("raw", [True, False])
+def test_vds_create_from_memmap_source(raw):
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        if raw:
+            source = MemmapSource(os.path.join(dir, "data.dat"), dtype=np.float32, shape=shape)
+            data.tofile(source.path)
+        else:
+            np.save(os.path.join(dir, "data.npy"), data)
+            source = MemmapSource(os.path.join(dir, "data.npy"), dtype=np.float32)
+            assert source.offset > 0 and source.shape == shape
+            with pytest.raises(ValueError):
+                MemmapSource(source.path, dtype=np.float64)
+            with pytest.raises(ValueError):
+                MemmapSource(source.path, shape=shape[::-1])
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                source
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create
+        ) as vds:
+            assert np.array_equal(data, vds[:, :, :])
+
+
+@pytest.mark.parametrize("init_value,expected", [(InitValue.NaN, np.nan), (InitValue.zero, 0.0)])
+def test_vds_init_value_pages_are_constant(init_value, expected):
+    shape = (251, 51, 126)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        VDS(
+            path,
+            axes=axes,
+            channels=[
+                Channel(
+                    name="Channel0",
+                    format=Formats.R64,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            init_value=init_value
+        ).close()
+        with VDS(path) as vds:
+            accessor = vds.channel(0).accessor
+            assert all(
+                openvds.volumeDataHash_IsConstant(accessor.getChunkVolumeDataHash(c))
+                for c in range(accessor.getChunkCount())
+            )
+            assert np.array_equal(vds[:, :, :], np.full(shape, expected), equal_nan=True)
+
+
+def test_vds_brick_reads_use_page_cache():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            page_cache_size=256 * 2**20,
+        ) as vds:
+            for i in range(64):
+                assert np.array_equal(data[i, 0, :5], vds[i, 0, :5])
+            assert vds.page_cache.stats["misses"] == 1
+            assert vds.page_cache.stats["hits"] == 63
+
+            chunk = vds.channel(0).get_chunk(0)
+            assert np.array_equal(data[chunk.slices], chunk[:, :, :])
+            assert vds.page_cache.stats["hits"] == 64
+
+
+def test_vds_bricks_read_engine():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            read_engine="bricks",
+            page_cache_size=256 * 2**20,
+        ) as vds:
+            keys = [
+                (slice(None), slice(None), slice(None)),
+                (slice(10, 200), slice(3, 40), slice(60, 70)),
+                (100, slice(None), slice(None)),
+                (5, 7, 100),
+                (slice(60, 70), 3, slice(None)),
+            ]
+            for key in keys:
+                assert np.array_equal(data[key], vds[key])
+            assert vds.page_cache.stats["misses"] == vds.channel(0).chunks_count
+
+        with pytest.raises(VDSException):
+            VDS(os.path.join(dir, "example.vds"), read_engine="unknown")
+
+
+def test_vds_chunk_geometry_matches_pages():
+    shape = (200, 51, 126)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels=[
+                Channel(
+                    name="Channel0",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            init_value=InitValue.zero
+        ) as vds:
+            channel = vds.channel(0)
+            geometry = channel.geometry
+            assert vds.chunks_count == geometry.count == channel.accessor.getChunkCount() == 8
+            assert len(list(channel.chunks())) == 8
+            for c in range(geometry.count):
+                page = channel.accessor.readPage(c)
+                _min, _max = page.getMinMax()
+                assert geometry.bounds(c) == (tuple(_min[2::-1]), tuple(_max[2::-1]))
+                page.release()
+                assert geometry.chunk_at(geometry.mins[c]) == c
+                assert channel.get_chunk(c).slices == geometry.slices(c)
+            assert geometry.chunk_at((199, 50, 125)) == 7
+            assert sorted(c for c, _, _ in geometry.intersecting((60, 0, 60), (70, 1, 70))) == [0, 1, 2, 3]
+            with pytest.raises(VDSException):
+                channel.get_chunk(8)
+
+
+@pytest.mark.parametrize("read_engine", ["subset", "bricks"])
+def test_vds_read_into_preallocated_array(read_engine):
+    shape = (200, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            read_engine=read_engine,
+        ) as vds:
+            out = np.empty(shape, dtype=np.float32)
+            vds[:, :, :]
+            tracemalloc.start()
+            result = vds.read_into((slice(None), slice(None), slice(None)), out)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert result is out
+            assert np.array_equal(out, data)
+            assert peak < out.nbytes / 4
+
+            out = np.empty((51, 10), dtype=np.float32, order="F")
+            vds.read_into((100, slice(None), slice(10, 20)), out)
+            assert np.array_equal(out, data[100, :, 10:20])
+
+            for key in [(slice(10, 0, -1), 3, slice(0, 5)), (slice(0, 10), slice(None, None, -1), 7)]:
+                expected = data[key]
+                out = np.empty(expected.shape, dtype=np.float32)
+                assert np.array_equal(vds.read_into(key, out), expected)
+                out = np.empty(expected.shape, dtype=np.float32)
+                assert np.array_equal(vds.channel(0).read_async(key, out=out).result(), expected)
+                assert np.array_equal(out, expected)
+
+            with pytest.raises(VDSException):
+                vds.read_into((slice(None), slice(None), slice(None)), np.empty((10, 10, 10), dtype=np.float32))
+
+
+@pytest.mark.parametrize("lod,page_cache_size", [(LOD._None, 0), (LOD._None, 2**20), (LOD._2, 2**20)])
+def test_vds_stepped_negative_and_ellipsis_keys(lod, page_cache_size):
+    shape = (200, 70, 130)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            lod=lod,
+            page_cache_size=page_cache_size,
+        ) as vds:
+            keys = [
+                (slice(None, None, 4), slice(None, None, 4), slice(None, None, 4)),
+                (slice(None, None, 4), slice(None, None, 4), slice(None)),
+                (slice(8, None, 8), 4, slice(20, 120, 4)),
+                (slice(None, None, -1), -1, slice(-10, None)),
+                (slice(150, 10, -7), slice(None, None, 65), slice(None, None, -3)),
+                (Ellipsis, slice(None, None, 2)),
+                (-5, Ellipsis),
+                (slice(None, None, 128), Ellipsis, -1),
+                (slice(5, 5), slice(None), slice(None)),
+            ]
+            for key in keys:
+                assert np.array_equal(data[key], vds[key]), key
+
+            with pytest.raises(VDSException):
+                vds[200, 0, 0]
+            with pytest.raises(VDSException):
+                vds[Ellipsis, 0, Ellipsis]
+
+            if page_cache_size:
+                vds.page_cache.clear()
+                misses = vds.page_cache.misses
+                vds[0, slice(None, None, 128), slice(None, None, 128)]
+                if lod == LOD._None:
+                    assert vds.page_cache.misses - misses == 2
+
+
+@pytest.mark.parametrize("page_cache_size", [0, 256 * 2**20])
+def test_vds_read_traces(page_cache_size):
+    shape = (200, 70, 130)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            page_cache_size=page_cache_size,
+        ) as vds:
+            coords = np.stack([np.random.randint(0, 200, 500), np.random.randint(0, 70, 500)], axis=1)
+            coords[:3] = [[0, 0], [199, 69], [0, 0]]
+            assert np.array_equal(vds.read_traces(coords), data[coords[:, 0], coords[:, 1], :])
+            assert np.array_equal(
+                vds.read_traces(coords, sample_range=(60, 70)), data[coords[:, 0], coords[:, 1], 60:70]
+            )
+            assert np.array_equal(
+                vds.read_traces(coords, sample_range=slice(-10, None)), data[coords[:, 0], coords[:, 1], -10:]
+            )
+            assert vds.read_traces(np.empty((0, 2))).shape == (0, 130)
+            if page_cache_size:
+                assert vds.page_cache.stats["misses"] == vds.chunks_count
+
+            with pytest.raises(VDSException):
+                vds.read_traces([[200, 0]])
+            with pytest.raises(VDSException):
+                vds.read_traces(coords, sample_range=(10, 200))
+
+
+def test_channel_sample_interpolation():
+    shape = (100, 70, 130)
+    i, j, k = np.meshgrid(*[np.arange(n, dtype=np.float32) for n in shape], indexing="ij")
+    data = 2 * i - j + 0.5 * k
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+        ) as vds:
+            channel = vds.channel(0)
+            points = np.random.rand(1000, 3) * (np.array(shape) - 1)
+            expected = 2 * points[:, 0] - points[:, 1] + 0.5 * points[:, 2]
+            assert np.allclose(channel.sample(points, "linear"), expected, atol=1e-4)
+
+            interior = 1 + np.random.rand(1000, 3) * (np.array(shape) - 4)
+            expected = 2 * interior[:, 0] - interior[:, 1] + 0.5 * interior[:, 2]
+            assert np.allclose(channel.sample(interior, "cubic"), expected, atol=1e-4)
+
+            nearest = channel.sample(points, "nearest")
+            rounded = np.floor(points + 0.5).astype(int)
+            assert nearest.dtype == np.float32
+            assert np.array_equal(nearest, data[rounded[:, 0], rounded[:, 1], rounded[:, 2]])
+
+            with pytest.raises(VDSException):
+                channel.sample([[0, 0, 130]])
+            with pytest.raises(VDSException):
+                channel.sample(points, "quadratic")
+
+
+def test_vds_lod_view():
+    shape = (200, 70, 130)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[
+                data
+            ],
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            lod=LOD._2,
+        ) as vds:
+            assert vds.lod_view(0) is vds.channel(0)
+            for level in (1, 2):
+                view = vds.lod_view(level)
+                factor = 1 << level
+                expected = data[::factor, ::factor, ::factor]
+                assert tuple(view.shape) == expected.shape
+                keys = [
+                    (slice(None), slice(None), slice(None)),
+                    (slice(3, 20), slice(None, None, 2), -1),
+                    (5, 7, slice(None)),
+                ]
+                for key in keys:
+                    assert np.array_equal(view[key], expected[key])
+                for chunk in view.chunks():
+                    assert np.array_equal(chunk[:, :, :], expected[chunk.slices])
+
+            assert vds.lod_for_resolution((50, 17, None)) == 2
+            assert vds.lod_for_resolution((60, None, None)) == 1
+            assert vds.lod_for_resolution((200, 70, 130)) == 0
+            assert vds.lod_view(resolution=(50, 17, 30)) is vds.lod_view(2)
+            with pytest.raises(VDSException):
+                vds.lod_view(3)
+
+
+def test_vds_page_accessors_are_created_lazily():
+    shape = (100, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    channels = [
+        Channel(
+            name=f"Attribute{i}",
+            format=Formats.R32,
+            unit="unitless",
+            value_range_min=0.0,
+            value_range_max=1.0,
+            components=Components._1
+        )
+        for i in range(3)
+    ]
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        VDS(
+            path,
+            axes=axes,
+            channels_data=[data, data, data],
+            channels=channels,
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+        ).close()
+
+        with VDS(
+            path,
+            max_pages=4,
+            page_cache_size=256 * 2**20,
+            channel_options={1: dict(max_pages=32), "Attribute2": dict(chunk_metadata_page_size=256)},
+        ) as vds:
+            assert all(c._accessor is None for c in vds.channels)
+            assert np.array_equal(vds[10:20, :, :], data[10:20])
+            assert all(c._accessor is None for c in vds.channels)
+
+            assert np.array_equal(vds.channel(1).get_chunk(0)[:, :, :], data[vds.channel(1).get_chunk(0).slices])
+            assert vds.channel(0)._accessor is None
+            assert vds.channel(1).accessor.getMaxPages() == 32
+            assert vds.channel(2).chunk_metadata_page_size == 256
+            assert vds.channel(2).accessor.getMaxPages() == 4
+
+            # single brick reads come from one page, located without the geometry of every chunk
+            misses = vds.page_cache.misses
+            assert np.array_equal(vds[70, 3, 64:70], data[70, 3, 64:70])
+            assert np.array_equal(vds.read_channels((5, slice(0, 5), 0))[0], data[5, :5, 0])
+            assert vds.channel(0)._accessor is not None and vds.channel(0)._geometry is None
+            assert vds.page_cache.misses == misses + 3
+
+
+@pytest.mark.parametrize("read_engine", ["subset", "bricks"])
+def test_vds_read_channels(read_engine, monkeypatch):
+    shape = (100, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[data, data * 2, data * 3],
+            channels=[
+                Channel(
+                    name=name,
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=3.0,
+                    components=Components._1
+                )
+                for name in ["Amplitude", "Envelope", "Phase"]
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+            read_engine=read_engine,
+        ) as vds:
+            key = (slice(10, 80), 3, slice(None))
+            expected = [data[key], data[key] * 2, data[key] * 3]
+            assert np.array_equal(vds.get_channel("Envelope")[key], expected[1])
+
+            stacked = vds.read_channels(key)
+            assert stacked.shape == (3, 70, 126)
+            assert np.array_equal(stacked, np.stack(expected))
+
+            selected = vds.read_channels(key, channels=["Phase", 0], layout="dict")
+            assert list(selected) == ["Phase", "Amplitude"]
+            assert np.array_equal(selected["Phase"], expected[2])
+            assert np.array_equal(selected["Amplitude"], expected[0])
+
+            structured = vds.read_channels(key, channels=[1, 2], layout="structured")
+            assert structured.dtype.names == ("Envelope", "Phase")
+            assert np.array_equal(structured["Envelope"], expected[1])
+            assert np.array_equal(structured["Phase"], expected[2])
+
+            assert np.array_equal(vds.read_channels((slice(None, None, 3), 0, 0))[2], data[::3, 0, 0] * 3)
+
+            flipped = (slice(10, 0, -1), 3, slice(0, 5))
+            assert np.array_equal(vds.read_channels(flipped), np.stack([data[flipped] * i for i in (1, 2, 3)]))
+
+            if read_engine == "bricks":
+                geometry = vds.channel(2).geometry
+                vds.channel(2)._geometry = ChunkGeometry(
+                    geometry.mins[:1], geometry.maxs[:1], geometry.inner_mins[:1], geometry.inner_maxs[:1], shape
+                )
+                copied = []
+                monkeypatch.setattr(vds.channel(0), "_copy_chunk", lambda *args: copied.append(args))
+                with pytest.raises(VDSException):
+                    vds.read_channels(key)
+                # waits for reads that would have been submitted before the check
+                vds.channel(0).executor.shutdown()
+                vds.channel(0)._executor = None
+                assert not copied
+            with pytest.raises(VDSException):
+                vds.read_channels(key, layout="columns")
+
+
+def test_channel_map_and_reduce_chunks():
+    shape = (100, 70, 130)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+
+    def smooth(x):
+        padded = np.pad(x, 1, mode="edge")
+        return sum(
+            np.roll(padded, shift, axis)[1:-1, 1:-1, 1:-1] for axis in range(3) for shift in (-1, 0, 1)
+        ) / 9
+
+    with TemporaryDirectory() as dir:
+        with VDS(
+            os.path.join(dir, "example.vds"),
+            axes=axes,
+            channels_data=[data, np.zeros_like(data), np.zeros_like(data)],
+            channels=[
+                Channel(
+                    name=name,
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+                for name in ["Amplitude", "Doubled", "Smoothed"]
+            ],
+            databrick_size=BrickSizes._64,
+            access_mode=AccessModes.Create,
+        ) as vds:
+            amplitude = vds.channel(0)
+            assert not vds.channel(1)[:, :, :].any()
+            amplitude.map_chunks(lambda x: x * 2, out_channel=vds.channel(1), workers=4)
+            assert np.array_equal(vds.channel(1)[:, :, :], data * 2)
+
+            amplitude.map_chunks(smooth, out_channel=vds.channel(2), workers=4, halo=1)
+            assert np.allclose(vds.channel(2)[:, :, :], smooth(data), atol=1e-6)
+
+            assert amplitude.reduce_chunks(np.size, lambda a, b: a + b) == data.size
+            assert np.isclose(amplitude.reduce_chunks(np.sum, lambda a, b: a + b, workers=4), data.sum(), rtol=1e-5)
+
+            with pytest.raises(VDSException):
+                amplitude.map_chunks(smooth, halo=1)
+
+        with VDS(os.path.join(dir, "example.vds"), access_mode=AccessModes.ReadWrite) as vds:
+            vds.channel(0).get_chunk(0)[:, :, :]
+            assert np.array_equal(vds[:, :, :], data)
+            assert np.array_equal(vds[10:90, 5:60, 20:120], data[10:90, 5:60, 20:120])
+            vds.channel(0).map_chunks(lambda x: x * 2, workers=4)
+            assert np.array_equal(vds[:, :, :], data * 2)
+            assert np.array_equal(vds[10:90, 5:60, 20:120], data[10:90, 5:60, 20:120] * 2)
+            assert np.array_equal(vds.channel(0).get_chunk(0)[:, :, :], data[vds.channel(0).get_chunk(0).slices] * 2)
+
+        with VDS(os.path.join(dir, "example.vds")) as vds:
+            assert np.array_equal(vds[:, :, :], data * 2)
+
+
+def test_metadata_snapshot_is_cached_and_loaded_lazily():
+    shape = (20, 30, 40)
+    data = np.random.rand(*shape).astype(np.float64)
+    metadata = {
+        "example": MetadataValue(value="value", category="category#1", type=MetadataTypes.String),
+        "payload": MetadataValue(value=b"\x00\x01\x02", category="category#2", type=MetadataTypes.BLOB),
+    }
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        with VDS(
+            path,
+            metadata_dict=metadata,
+            axes=[
+                Axis(samples=s, name=str(i), unit="unitless", coordinate_min=0.0, coordinate_max=1.0)
+                for i, s in enumerate(shape)
+            ],
+            channels=[
+                Channel(
+                    name="Channel0",
+                    format=Formats.R64,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            channels_data=[data],
+            access_mode=AccessModes.Create
+        ):
+            pass
+
+        with VDS(path) as vds:
+            assert vds.get_metadata("example", "category#1") == "value"
+            assert bytes(vds.get_metadata("payload")) == b"\x00\x01\x02"
+            assert vds._metadata is None and len(vds._metadata_index) == 2
+            with pytest.raises(VDSMetadataException):
+                vds.get_metadata("missing")
+            assert vds.metadata["example"] is vds._metadata_index[("category#1", "example")]
+
+        with VDS(path) as vds:
+            assert vds.metadata is vds.metadata
+            assert not vds.metadata["payload"]._loaded
+            payload = vds.get_metadata("payload")
+            assert isinstance(payload, memoryview)
+            assert bytes(payload) == b"\x00\x01\x02"
+            assert vds.get_metadata("example", "category#1") == "value"
+            with pytest.raises(VDSMetadataException):
+                vds.get_metadata("example", "category#2")
+
+            snapshot = vds.metadata
+            vds.invalidate_metadata()
+            assert vds.metadata is not snapshot
+            assert vds.metadata["example"].value == "value"
+            unread = vds.metadata["payload"]
+        with pytest.raises(VDSMetadataException):
+            unread.value
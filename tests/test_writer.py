@@ -0,0 +1,55 @@
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+from ovds_utils.exceptions import VDSException
+from ovds_utils.ovds.enums import BrickSizes, Formats
+from ovds_utils.vds import VDS, AccessModes, Axis, Channel, Components
+from ovds_utils.writer import VDSWriter
+
+
+def test_vds_writer_streams_slabs():
+    shape = (251, 51, 126)
+    data = np.random.rand(*shape).astype(np.float32)
+    names = ["Sample", "Crossline", "Inline"]
+    axes = [
+        Axis(
+            samples=s,
+            name=names[i],
+            unit="unitless",
+            coordinate_max=1000.0,
+            coordinate_min=-1000.0
+        )
+        for i, s in enumerate(shape)
+    ]
+    with TemporaryDirectory() as dir:
+        path = os.path.join(dir, "example.vds")
+        with VDSWriter(
+            path,
+            axes=axes,
+            channels=[
+                Channel(
+                    name="Amplitude",
+                    format=Formats.R32,
+                    unit="unitless",
+                    value_range_min=0.0,
+                    value_range_max=1.0,
+                    components=Components._1
+                )
+            ],
+            databrick_size=BrickSizes._64,
+        ) as writer:
+            writer.write_slabs(
+                ((i, i + 10), data[i:i + 10]) for i in range(0, 240, 10)
+            )
+            writer.write_slab(slice(240, None), data[240:])
+            assert writer.missing_rows == [[]]
+            assert writer._buffers == [{}]
+            with pytest.raises(VDSException):
+                writer.write_slab(slice(None, 10), data[0:10])
+
+        with VDS(path, access_mode=AccessModes.ReadOnly) as vds:
+            assert vds.shape == shape
+            assert np.array_equal(data, vds[:, :, :])